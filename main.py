@@ -6,8 +6,7 @@ A PyQt6-based translation overlay for Linux Wayland KDE Plasma
 
 import sys
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from xian.main_window import MainWindow
+from xian.main_window import MainWindow, app_icon
 from xian.screen_capture import SCREENSHOT_AVAILABLE
 from xian.logging_config import setup_logger
 import logging
@@ -18,7 +17,7 @@ def main():
     setup_logger(level=logging.DEBUG)
     
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("xian.png"))
+    app.setWindowIcon(app_icon())
 
     # Check for required dependencies
     if not SCREENSHOT_AVAILABLE:
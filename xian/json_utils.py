@@ -0,0 +1,22 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib."""
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # orjson.loads accepts str or bytes, like json.loads
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        """Serialize obj to a compact JSON string"""
+        return orjson.dumps(obj).decode()
+else:
+    loads = json.loads
+
+    def dumps(obj) -> str:
+        """Serialize obj to a compact JSON string"""
+        return json.dumps(obj, separators=(",", ":"))
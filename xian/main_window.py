@@ -1,28 +1,182 @@
-import json
 import logging
+from collections import deque
+from contextlib import ExitStack
+from functools import lru_cache, partial
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QComboBox, QSpinBox, QCheckBox, QGroupBox, QSlider, QTabWidget,
-    QListWidget, QListWidgetItem, QFormLayout, QLineEdit, QSystemTrayIcon, QMenu,
+    QListWidget, QListWidgetItem, QListView, QFormLayout, QLineEdit, QSystemTrayIcon, QMenu,
     QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, QRect, QSettings, pyqtSlot
-from PyQt6.QtGui import QIcon, QShortcut, QKeySequence
+from PyQt6.QtCore import (
+    Qt, QTimer, QRect, QSignalBlocker, QAbstractListModel, QModelIndex, pyqtSlot
+)
+from PyQt6.QtGui import QIcon, QShortcut, QKeySequence, QColor
 
 from .qwen_pipeline import VLProcessor, VLConfig
 from .qwen_translation_workers import QwenTranslationWorker, QwenTranslatorStatusWorker, QwenModelWarmupWorker
 from .overlay_ui import TranslationOverlay
 from .region_selector import RegionSelector
 from .models import TranslationMode, TranslationRegion
+from .settings import setting, store_setting, clear_settings, sync_settings
+from . import json_utils
 
 logger = logging.getLogger(__name__)
 
+# Global shortcuts by action name
+_SHORTCUT_KEYS = {"clear": "Ctrl+L", "hide": "Ctrl+H", "start": "Ctrl+S", "stop": "Ctrl+T"}
+
+
+@lru_cache(maxsize=None)
+def _shortcut(action: str) -> QKeySequence:
+    """Return the parsed key sequence for a shortcut, built on first use"""
+    return QKeySequence(_SHORTCUT_KEYS[action])
+
+
+# Overlay panel mode combo text -> TranslationMode (anything else is region selection)
+_MODE_MAP = {"Full Screen": TranslationMode.FULL_SCREEN}
+
+# Modern dark theme for the main window, parsed by Qt once per window
+_MAIN_WINDOW_QSS = """
+    QMainWindow {
+        background-color: #121212;
+    }
+    QWidget#CentralWidget {
+        background-color: #121212;
+    }
+    QGroupBox {
+        color: #4CAF50;
+        font-weight: bold;
+        border: 1px solid #333;
+        border-radius: 8px;
+        margin-top: 1.5ex;
+        padding: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 5px;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+    QPushButton {
+        background-color: #333;
+        color: white;
+        border-radius: 4px;
+        padding: 6px 12px;
+        border: 1px solid #444;
+    }
+    QPushButton:hover {
+        background-color: #444;
+    }
+    QPushButton#StartBtn {
+        background-color: #2e7d32;
+        font-weight: bold;
+    }
+    QPushButton#StopBtn {
+        background-color: #c62828;
+        font-weight: bold;
+    }
+    QComboBox, QSpinBox, QLineEdit {
+        background-color: #1e1e1e;
+        color: white;
+        border: 1px solid #333;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #333;
+        background: #121212;
+    }
+    QTabBar::tab {
+        background: #1e1e1e;
+        color: #888;
+        padding: 8px 16px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected {
+        background: #333;
+        color: white;
+    }
+    QListView {
+        background-color: #1e1e1e;
+        color: #ccc;
+        border: 1px solid #333;
+        border-radius: 4px;
+    }
+    QLabel#TitleLabel {
+        font-size: 24px;
+        font-weight: bold;
+        color: #4CAF50;
+    }
+    QLabel#HeaderStatus {
+        color: #888;
+    }
+    QPushButton#ClearBtn {
+        background-color: #ff9800;
+        color: white;
+        font-weight: bold;
+    }
+    QPushButton#ResetBtn {
+        background-color: #f44336;
+        color: white;
+        font-weight: bold;
+    }
+"""
+
+@lru_cache(maxsize=None)
+def app_icon() -> QIcon:
+    """Application icon, decoded from disk once (requires a QApplication)."""
+    return QIcon("xian.png")
+
+
+class _LogListModel(QAbstractListModel):
+    """Newest-first activity log bounded to a fixed number of lines"""
+
+    _FOREGROUND = QColor("#333")
+
+    def __init__(self, parent=None, max_lines: int = 50):
+        super().__init__(parent)
+        self._lines = deque(maxlen=max_lines)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._lines[index.row()]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._FOREGROUND
+        return None
+
+    def prepend_lines(self, lines: list):
+        """Insert lines (oldest first) at the top, dropping rows beyond capacity."""
+        lines = lines[-self._lines.maxlen:]
+        if not lines:
+            return
+        overflow = len(self._lines) + len(lines) - self._lines.maxlen
+        if overflow > 0:
+            count = len(self._lines)
+            self.beginRemoveRows(QModelIndex(), count - overflow, count - 1)
+            for _ in range(overflow):
+                self._lines.pop()
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), 0, len(lines) - 1)
+        self._lines.extendleft(lines)  # newest line ends up at row 0
+        self.endInsertRows()
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
 
     def __init__(self):
         super().__init__()
-        self.setWindowIcon(QIcon("xian.png"))
+        self.setWindowIcon(app_icon())
         self.qwen_processor = VLProcessor()
         self.translation_worker = QwenTranslationWorker(self.qwen_processor)
         self.translator_status_worker = QwenTranslatorStatusWorker(self.qwen_processor)
@@ -30,15 +184,50 @@ class MainWindow(QMainWindow):
         self.translation_overlay = TranslationOverlay(self)
         self.region_selector = None
         self.regions = []
-        self.settings = QSettings("Xian", "VideoGameTranslator")
+        # Set whenever self.regions is mutated so save_settings only re-serializes on change
+        self._regions_dirty = False
+        # Reads and writes go through the shared cache in xian.settings, which mirrors the
+        # store for every window, so a value is only written back when it actually changes.
 
         # Debounce timer for API status checks
         self.api_check_timer = QTimer()
         self.api_check_timer.setSingleShot(True)
         self.api_check_timer.setInterval(1000)  # 1 second debounce
         self.api_check_timer.timeout.connect(self._do_api_status_check)
+        self._status_check_pending = False
+        # Model text the last status check ran for; unchanged re-triggers are ignored
+        self._last_checked_model = None
+        # Overlay panel values seen by the last _sync_settings_from_panel; cleared
+        # whenever the main window pushes values into the panel itself
+        self._last_panel_snapshot = {}
+        # Model list last pushed into api_model_edit, to skip repopulating it unchanged
+        self._last_models = ()
+
+        # Debounce timer for persisting settings; coalesces bursts of widget changes
+        # (e.g. slider drags) into a single write of just the keys that changed
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_settings)
+        self._dirty_keys = set()
+
+        # Debounce timer for mirroring overlay panel changes; a slider drag emits
+        # settings_changed on every tick
+        self._panel_sync_timer = QTimer()
+        self._panel_sync_timer.setSingleShot(True)
+        self._panel_sync_timer.setInterval(150)
+        self._panel_sync_timer.timeout.connect(self._sync_settings_from_panel)
+
+        # Status messages can arrive in bursts; collect them and insert into the
+        # activity log in one batch per timer tick
+        self._pending_log = []
+        self._log_flush_timer = QTimer()
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log)
 
         self.setup_ui()
+        self._setting_readers = self._build_setting_readers()
         self.setup_tray_icon()
         self.connect_signals()
         self.load_settings()
@@ -57,77 +246,7 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(600, 500)
         self.resize(650, 550)
         
-        # Modern dark theme for the main window
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #121212;
-            }
-            QWidget#CentralWidget {
-                background-color: #121212;
-            }
-            QGroupBox {
-                color: #4CAF50;
-                font-weight: bold;
-                border: 1px solid #333;
-                border-radius: 8px;
-                margin-top: 1.5ex;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QPushButton {
-                background-color: #333;
-                color: white;
-                border-radius: 4px;
-                padding: 6px 12px;
-                border: 1px solid #444;
-            }
-            QPushButton:hover {
-                background-color: #444;
-            }
-            QPushButton#StartBtn {
-                background-color: #2e7d32;
-                font-weight: bold;
-            }
-            QPushButton#StopBtn {
-                background-color: #c62828;
-                font-weight: bold;
-            }
-            QComboBox, QSpinBox, QLineEdit {
-                background-color: #1e1e1e;
-                color: white;
-                border: 1px solid #333;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #333;
-                background: #121212;
-            }
-            QTabBar::tab {
-                background: #1e1e1e;
-                color: #888;
-                padding: 8px 16px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background: #333;
-                color: white;
-            }
-            QListWidget {
-                background-color: #1e1e1e;
-                color: #ccc;
-                border: 1px solid #333;
-                border-radius: 4px;
-            }
-        """)
+        self.setStyleSheet(_MAIN_WINDOW_QSS)
 
         central_widget = QWidget()
         central_widget.setObjectName("CentralWidget")
@@ -138,12 +257,12 @@ class MainWindow(QMainWindow):
         # Header
         header = QHBoxLayout()
         title_label = QLabel("Xian")
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #4CAF50;")
+        title_label.setObjectName("TitleLabel")
         header.addWidget(title_label)
         header.addStretch()
         
         self.header_status = QLabel("Ready")
-        self.header_status.setStyleSheet("color: #888;")
+        self.header_status.setObjectName("HeaderStatus")
         header.addWidget(self.header_status)
         layout.addLayout(header)
 
@@ -155,9 +274,12 @@ class MainWindow(QMainWindow):
         general_tab = self._create_general_tab()
         self.tabs.addTab(general_tab, "General")
 
-        # Regions tab
-        regions_tab = self._create_regions_tab()
-        self.tabs.addTab(regions_tab, "Regions")
+        # Regions tab (built lazily on first visit; only used in region-select mode)
+        self.regions_list = None
+        self._regions_tab_container = QWidget()
+        QVBoxLayout(self._regions_tab_container).setContentsMargins(0, 0, 0, 0)
+        self.tabs.addTab(self._regions_tab_container, "Regions")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Settings tab
         settings_tab = self._create_settings_tab()
@@ -185,7 +307,7 @@ class MainWindow(QMainWindow):
     def setup_tray_icon(self):
         """Initialize system tray icon and menu"""
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon("xian.png"))
+        self.tray_icon.setIcon(app_icon())
         
         tray_menu = QMenu()
         
@@ -209,6 +331,11 @@ class MainWindow(QMainWindow):
         self.tray_icon.activated.connect(self._on_tray_activated)
         self.tray_icon.show()
 
+    def _set_tray_toggle_text(self, text: str):
+        """Relabel the tray start/stop action only when the label actually changes"""
+        if self.tray_toggle_action.text() != text:
+            self.tray_toggle_action.setText(text)
+
     def _on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.Trigger:
             self.show_overlay_settings_panel()
@@ -283,7 +410,7 @@ class MainWindow(QMainWindow):
 
         # Clear translations button
         self.clear_translations_button = QPushButton("Clear All Translations (Ctrl+L)")
-        self.clear_translations_button.setStyleSheet("background-color: #ff9800; color: white; font-weight: bold;")
+        self.clear_translations_button.setObjectName("ClearBtn")
         layout.addWidget(self.clear_translations_button)
 
         self.hide_overlay_checkbox = QCheckBox("Hide All Translations (Ctrl+H)")
@@ -293,9 +420,15 @@ class MainWindow(QMainWindow):
         # Log area
         log_group = QGroupBox("Activity Log")
         log_layout = QVBoxLayout(log_group)
-        self.log_list = QListWidget()
+        self.log_model = _LogListModel(self)
+        self.log_list = QListView()
+        self.log_list.setModel(self.log_model)
+        self.log_list.setUniformItemSizes(True)
         self.log_list.setMinimumHeight(150)
-        self.log_list.setStyleSheet("font-size: 11px; color: #333;")
+        # Font/colour via QFont and ForegroundRole rather than a per-widget stylesheet
+        log_font = self.log_list.font()
+        log_font.setPixelSize(11)
+        self.log_list.setFont(log_font)
         log_layout.addWidget(self.log_list)
         layout.addWidget(log_group)
 
@@ -328,6 +461,15 @@ class MainWindow(QMainWindow):
 
         return widget
 
+    def _on_tab_changed(self, index: int):
+        """Build tab contents that are deferred until first shown."""
+        if self.tabs.widget(index) is self._regions_tab_container and self.regions_list is None:
+            self._regions_tab_container.layout().addWidget(self._create_regions_tab())
+            self.add_region_button.clicked.connect(self.add_region)
+            self.remove_region_button.clicked.connect(self.remove_region)
+            self.test_region_button.clicked.connect(self.test_region)
+            self.update_regions_list()
+
     def _create_settings_tab(self) -> QWidget:
         """Create settings tab"""
         widget = QWidget()
@@ -347,6 +489,7 @@ class MainWindow(QMainWindow):
         self.api_model_edit.addItem("TranslateGemma-4B (Lower Resource)")
         self.api_model_edit.setToolTip("Vision-Language model (Qwen3.5 or TranslateGemma)")
         self.api_status_label = QLabel("Checking...")
+        self.api_status_label.setStyleSheet("color: #888")
 
         translator_layout.addRow("Model:", self.api_model_edit)
         translator_layout.addRow("Status:", self.api_status_label)
@@ -368,7 +511,7 @@ class MainWindow(QMainWindow):
         self.max_tokens_slider.setValue(1024)
         self.max_tokens_slider.setToolTip("Maximum tokens for the model response")
         max_tokens_label = QLabel(f"{self.max_tokens_slider.value()}")
-        self.max_tokens_slider.valueChanged.connect(lambda v: max_tokens_label.setText(str(v)))
+        self.max_tokens_slider.valueChanged.connect(max_tokens_label.setNum)
         max_tokens_hbox = QHBoxLayout()
         max_tokens_hbox.addWidget(self.max_tokens_slider)
         max_tokens_hbox.addWidget(max_tokens_label)
@@ -406,7 +549,7 @@ class MainWindow(QMainWindow):
 
         # Clear settings button
         self.reset_button = QPushButton("Reset All Settings")
-        self.reset_button.setStyleSheet("background-color: #f44336; color: white; font-weight: bold;")
+        self.reset_button.setObjectName("ResetBtn")
         layout.addWidget(self.reset_button)
 
         layout.addStretch()
@@ -416,24 +559,21 @@ class MainWindow(QMainWindow):
         """Connect UI signals"""
         self.start_button.clicked.connect(self.start_translation)
         self.stop_button.clicked.connect(self.stop_translation)
-        self.add_region_button.clicked.connect(self.add_region)
-        self.remove_region_button.clicked.connect(self.remove_region)
-        self.test_region_button.clicked.connect(self.test_region)
         self.reset_button.clicked.connect(self.reset_settings)
         self.clear_translations_button.clicked.connect(self.clear_all_translations)
         self.hide_overlay_checkbox.toggled.connect(self.toggle_overlay_visibility)
 
         # Shortcuts
-        self.clear_shortcut = QShortcut(QKeySequence("Ctrl+L"), self)
+        self.clear_shortcut = QShortcut(_shortcut("clear"), self)
         self.clear_shortcut.activated.connect(self.clear_all_translations)
         
-        self.hide_shortcut = QShortcut(QKeySequence("Ctrl+H"), self)
-        self.hide_shortcut.activated.connect(lambda: self.hide_overlay_checkbox.setChecked(not self.hide_overlay_checkbox.isChecked()))
+        self.hide_shortcut = QShortcut(_shortcut("hide"), self)
+        self.hide_shortcut.activated.connect(self.hide_overlay_checkbox.toggle)
 
-        self.start_shortcut = QShortcut(QKeySequence("Ctrl+S"), self)
+        self.start_shortcut = QShortcut(_shortcut("start"), self)
         self.start_shortcut.activated.connect(self.start_translation)
         
-        self.stop_shortcut = QShortcut(QKeySequence("Ctrl+T"), self)
+        self.stop_shortcut = QShortcut(_shortcut("stop"), self)
         self.stop_shortcut.activated.connect(self.stop_translation)
 
         self.full_screen_radio.toggled.connect(self.on_mode_changed)
@@ -451,10 +591,16 @@ class MainWindow(QMainWindow):
             # In case widgets are not yet available in some init paths
             pass
 
-        self.debug_mode_checkbox.toggled.connect(self.save_settings)
-        self.overlay_opacity_slider.valueChanged.connect(self.save_settings)
-        self.redaction_margin_spin.valueChanged.connect(self.save_settings)
-        self.minimize_on_start_checkbox.toggled.connect(self.save_settings)
+        # Widgets whose changes only need persisting, with the settings key each one feeds
+        save_signals = (
+            (self.debug_mode_checkbox.toggled, "debug_mode"),
+            (self.interval_spinbox.valueChanged, "interval"),
+            (self.overlay_opacity_slider.valueChanged, "opacity"),
+            (self.redaction_margin_spin.valueChanged, "redaction_margin"),
+            (self.minimize_on_start_checkbox.toggled, "minimize_on_start"),
+        )
+        for signal, key in save_signals:
+            signal.connect(partial(self._on_setting_widget_changed, key))
         
         # Connect Qwen3.5 specific settings
         self.thinking_mode_checkbox.toggled.connect(self._on_thinking_mode_changed)
@@ -462,39 +608,45 @@ class MainWindow(QMainWindow):
         self.model_size_combo.currentTextChanged.connect(self._on_model_size_changed)
 
         self.translator_status_worker.status_changed.connect(self._on_api_status_changed)
+        self.translator_status_worker.finished.connect(self._on_status_worker_finished)
 
-        self.translation_worker.status_update.connect(
-            self.header_status.setText
-        )
-        self.translation_worker.status_update.connect(
-            self.add_log
-        )
+        # Worker signals are emitted from its run() thread; queue them explicitly onto the GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self.translation_worker.status_update.connect(self._on_status_update, queued)
         self.translation_worker.translation_ready.connect(
-            self.translation_overlay.update_translations
+            self.translation_overlay.update_translations, queued
         )
         self.translation_worker.request_hide_overlay.connect(
-            self.on_translation_worker_capture_prepare
+            self.on_translation_worker_capture_prepare, queued
         )
         self.translation_worker.request_show_overlay.connect(
-            self.translation_overlay.show
+            self.translation_overlay.show, queued
         )
 
         self.translation_overlay.control_panel.request_start.connect(self.start_translation)
         self.translation_overlay.control_panel.request_stop.connect(self.stop_translation)
         self.translation_overlay.control_panel.request_reset_settings.connect(self.reset_settings)
-        self.translation_overlay.control_panel.settings_changed.connect(self._sync_settings_from_panel)
+        self.translation_overlay.control_panel.settings_changed.connect(self._panel_sync_timer.start)
 
         self.model_warmup_worker.warmup_finished.connect(self._on_model_warmup_finished)
 
+    def _schedule_save(self, *keys: str):
+        """Mark settings keys as changed and request a debounced flush."""
+        self._dirty_keys.update(keys)
+        self._save_timer.start()
+
+    def _on_setting_widget_changed(self, key: str, *_):
+        self._schedule_save(key)
+
     def _on_thinking_mode_changed(self, checked: bool):
         """Handle thinking mode toggle change"""
         self.qwen_processor.config.thinking_mode = checked
-        self.save_settings()
+        self._schedule_save("thinking_mode")
 
     def _on_max_tokens_changed(self, value: int):
         """Handle max tokens slider change"""
         self.qwen_processor.config.max_tokens = value
-        self.save_settings()
+        self._schedule_save("max_tokens")
 
     def _on_model_size_changed(self, text: str):
         """Handle model size combo change"""
@@ -504,130 +656,135 @@ class MainWindow(QMainWindow):
             self.qwen_processor.config.model_size = "8b"
         else:  # Auto-detect
             self.qwen_processor.config.model_size = "auto"
-        self.save_settings()
+        self._schedule_save("model_size_override")
 
     def _on_main_model_changed(self, text: str):
         """Propagate model selection from main settings -> overlay panel + translator, and persist."""
         try:
             panel = self.translation_overlay.control_panel
-            panel.blockSignals(True)
-            panel.model_combo.setCurrentText(text)
+            with QSignalBlocker(panel):
+                panel.model_combo.setCurrentText(text)
+            self._last_panel_snapshot = {}
         except Exception:
             pass
-        finally:
-            try:
-                panel.blockSignals(False)
-            except Exception:
-                pass
 
         # Update processor and save
         # For QwenVLProcessor, model selection is handled differently
-        self.save_settings()
+        self._schedule_save("api_model")
 
     def _on_main_source_changed(self, text: str):
         """Mirror main Source language selection to overlay panel and persist."""
         try:
             panel = self.translation_overlay.control_panel
-            panel.blockSignals(True)
-            panel.source_lang_combo.setCurrentText(text)
+            with QSignalBlocker(panel):
+                panel.source_lang_combo.setCurrentText(text)
+            self._last_panel_snapshot = {}
         except Exception:
             pass
-        finally:
-            try:
-                panel.blockSignals(False)
-            except Exception:
-                pass
         # Save settings
-        self.save_settings()
+        self._schedule_save("source_lang")
 
     def _on_main_target_changed(self, text: str):
         """Mirror main Target language selection to overlay panel and persist."""
         try:
             panel = self.translation_overlay.control_panel
-            panel.blockSignals(True)
-            panel.target_lang_combo.setCurrentText(text)
+            with QSignalBlocker(panel):
+                panel.target_lang_combo.setCurrentText(text)
+            self._last_panel_snapshot = {}
         except Exception:
             pass
-        finally:
-            try:
-                panel.blockSignals(False)
-            except Exception:
-                pass
         # Save settings
-        self.save_settings()
+        self._schedule_save("target_lang")
+
+    def _snapshot_panel(self) -> dict:
+        """Read the overlay panel's translation settings in one pass"""
+        panel = self.translation_overlay.control_panel
+        return {
+            "mode": _MODE_MAP.get(panel.mode_combo.currentText(), TranslationMode.REGION_SELECT),
+            "source_lang": panel.source_lang_combo.currentText(),
+            "target_lang": panel.target_lang_combo.currentText(),
+            "model": panel.model_combo.currentText(),
+            "interval": panel.interval_spin.value(),
+            "opacity": panel.opacity_slider.value(),
+            "redaction_margin": panel.margin_spin.value(),
+        }
 
     def _sync_settings_from_panel(self):
         """Update worker and internal state when settings are changed in the overlay panel.
         IMPORTANT: Do NOT call load_settings() here, as it overwrites the panel's current
         selections with persisted values and makes it impossible to change models from the panel.
         """
-        panel = self.translation_overlay.control_panel
-
-        # Determine mode
-        mode = TranslationMode.FULL_SCREEN if panel.mode_combo.currentText() == "Full Screen" else TranslationMode.REGION_SELECT
+        snap = self._snapshot_panel()
+        # Only act on fields that differ from the previous sync
+        previous, self._last_panel_snapshot = self._last_panel_snapshot, snap
+        changed = {key for key, value in snap.items() if previous.get(key) != value}
+        if not changed:
+            return
 
         # Push panel settings to running worker (if active)
-        if self.translation_worker.running:
+        if self.translation_worker.running and changed - {"model", "opacity"}:
             self.translation_worker.set_config(
-                mode=mode,
+                mode=snap["mode"],
                 regions=self.regions,
-                source_lang=panel.source_lang_combo.currentText(),
-                target_lang=panel.target_lang_combo.currentText(),
-                interval=panel.interval_spin.value(),
-                redaction_margin=panel.margin_spin.value(),
+                source_lang=snap["source_lang"],
+                target_lang=snap["target_lang"],
+                interval=snap["interval"],
+                redaction_margin=snap["redaction_margin"],
             )
 
         # Sync model selection from panel -> main + processor
-        new_model = panel.model_combo.currentText()
-        if new_model:
-            try:
-                self.api_model_edit.blockSignals(True)
+        new_model = snap["model"]
+        if "model" in changed and new_model:
+            with QSignalBlocker(self.api_model_edit):
                 self.api_model_edit.setCurrentText(new_model)
-            finally:
-                self.api_model_edit.blockSignals(False)
             # For QwenVLProcessor, model selection is handled differently
 
         # Apply unified opacity instantly across overlay components
-        self.translation_overlay.set_opacity(panel.opacity_slider.value())
-
-        # Mirror other settings from panel -> main widgets
-        try:
-            self.source_lang_combo.blockSignals(True)
-            self.target_lang_combo.blockSignals(True)
-            self.interval_spinbox.blockSignals(True)
-            self.overlay_opacity_slider.blockSignals(True)
-            self.redaction_margin_spin.blockSignals(True)
-
-            self.source_lang_combo.setCurrentText(panel.source_lang_combo.currentText())
-            self.target_lang_combo.setCurrentText(panel.target_lang_combo.currentText())
-            self.interval_spinbox.setValue(panel.interval_spin.value())
-            self.overlay_opacity_slider.setValue(panel.opacity_slider.value())
-            self.redaction_margin_spin.setValue(panel.margin_spin.value())
-        finally:
-            try:
-                self.source_lang_combo.blockSignals(False)
-                self.target_lang_combo.blockSignals(False)
-                self.interval_spinbox.blockSignals(False)
-                self.overlay_opacity_slider.blockSignals(False)
-                self.redaction_margin_spin.blockSignals(False)
-            except Exception:
-                pass
+        if "opacity" in changed:
+            self.translation_overlay.set_opacity(snap["opacity"])
+
+        # Mirror changed settings from panel -> main widgets
+        mirrors = {
+            "source_lang": (self.source_lang_combo, "setCurrentText"),
+            "target_lang": (self.target_lang_combo, "setCurrentText"),
+            "interval": (self.interval_spinbox, "setValue"),
+            "opacity": (self.overlay_opacity_slider, "setValue"),
+            "redaction_margin": (self.redaction_margin_spin, "setValue"),
+        }
+        for key in changed & mirrors.keys():
+            widget, setter = mirrors[key]
+            with QSignalBlocker(widget):
+                getattr(widget, setter)(snap[key])
 
         # Persist new settings
-        self.save_settings()
+        self._schedule_save(*("api_model" if key == "model" else key for key in changed if key != "mode"))
 
-        # Optionally refresh API status to reflect new model selection
-        self.check_api_status()
+        # Refresh API status to reflect new model selection
+        if "model" in changed:
+            self.check_api_status()
+
+    @pyqtSlot(str)
+    def _on_status_update(self, message: str):
+        """Show a worker status message in the header and the activity log"""
+        self.header_status.setText(message)
+        self.add_log(message)
 
     def add_log(self, message):
-        """Add message to activity log"""
-        self.log_list.insertItem(0, message)
-        if self.log_list.count() > 50:
-            self.log_list.takeItem(self.log_list.count() - 1)
+        """Add message to activity log (batched, flushed at most every 100 ms)"""
+        self._pending_log.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        lines, self._pending_log = self._pending_log, []
+        self.log_model.prepend_lines(lines)
 
+    @pyqtSlot()
     def on_translation_worker_capture_prepare(self):
         """Handle worker preparing for capture: update geometries (used to hide)"""
-        # Update worker with latest bubble geometries for redaction
+        # Update worker with latest bubble geometries for redaction; a batch still held by
+        # the overlay's coalescing timer must become bubbles first or they'd go unredacted
+        self.translation_overlay.flush_pending_translations()
         geoms = self.translation_overlay.get_redaction_geometries()
         self.translation_worker.set_active_geometries(geoms)
         
@@ -636,39 +793,64 @@ class MainWindow(QMainWindow):
 
     def check_api_status(self):
         """Start the API status check process with debouncing"""
-        self.api_status_label.setText("Checking...")
-        self.api_status_label.setStyleSheet("color: #888")
+        # Only restart the timer here; the label is updated once per burst in
+        # _do_api_status_check so typing does not repaint it on every keystroke.
+        if self.api_model_edit.currentText() == self._last_checked_model and not self.api_check_timer.isActive():
+            # Already checked for this exact selection
+            return
         self.api_check_timer.start()
 
     def _do_api_status_check(self):
         """Perform the actual Qwen processor status check in a background thread"""
+        self._set_api_status("Checking...", "#888")
         # For QwenVLProcessor, model selection is handled differently
         # We'll pass the model size setting to the processor
-        model_text = self.api_model_edit.currentText()
+        self._last_checked_model = self.api_model_edit.currentText()
         
         if self.translator_status_worker.isRunning():
-            self.translator_status_worker.terminate()
-            self.translator_status_worker.wait()
+            # Never terminate() a QThread mid-run: ask it to drop its now-stale result
+            # and re-check once it finishes
+            self.translator_status_worker.requestInterruption()
+            self._status_check_pending = True
+            return
+
+        self.translator_status_worker.start()
 
+    def _on_status_worker_finished(self):
+        """Run a status check that was requested while the previous one was in flight."""
+        if not self._status_check_pending:
+            return
+        if self.translator_status_worker.isRunning():
+            # finished is emitted before the thread clears its running state, so start()
+            # would be a no-op here; retry once the event loop comes back round
+            QTimer.singleShot(0, self._on_status_worker_finished)
+            return
+        self._status_check_pending = False
         self.translator_status_worker.start()
 
+    @pyqtSlot(bool, list)
     def _on_api_status_changed(self, is_available: bool, models: list):
         """Handle the result of the API status check"""
         if is_available:
-            self.api_status_label.setText("✓ Connected")
-            self.api_status_label.setStyleSheet("color: #4CAF50")
+            self._set_api_status("✓ Connected", "#4CAF50")
             
-            # Update models list if we got any
-            if models:
+            # Update models list if we got any (and it differs from what is shown)
+            if models and tuple(models) != self._last_models:
+                self._last_models = tuple(models)
                 current_model = self.api_model_edit.currentText()
-                self.api_model_edit.blockSignals(True)
-                self.api_model_edit.clear()
-                self.api_model_edit.addItems(models)
-                self.api_model_edit.setCurrentText(current_model)
-                self.api_model_edit.blockSignals(False)
+                with QSignalBlocker(self.api_model_edit):
+                    self.api_model_edit.clear()
+                    self.api_model_edit.addItems(models)
+                    self.api_model_edit.setCurrentText(current_model)
         else:
-            self.api_status_label.setText("✗ Disconnected")
-            self.api_status_label.setStyleSheet("color: #f44336")
+            self._set_api_status("✗ Disconnected", "#f44336")
+
+    def _set_api_status(self, text: str, color: str):
+        """Update the status label, re-applying its stylesheet only on a state change"""
+        if self.api_status_label.text() == text:
+            return
+        self.api_status_label.setText(text)
+        self.api_status_label.setStyleSheet(f"color: {color}")
 
     def toggle_overlay_visibility(self, visible):
         """Toggle translation overlay visibility"""
@@ -695,7 +877,7 @@ class MainWindow(QMainWindow):
         elif sender == self.region_select_radio:
             self.full_screen_radio.setChecked(False)
         
-        self.save_settings()
+        self._schedule_save("translation_mode")
 
     def add_region(self):
         """Add new translation region"""
@@ -710,14 +892,16 @@ class MainWindow(QMainWindow):
             f"Region {len(self.regions) + 1}"
         )
         self.regions.append(region)
-        self.update_regions_list()
+        self._regions_dirty = True
+        self._append_region_item(region)
 
     def remove_region(self):
         """Remove selected region"""
         current_row = self.regions_list.currentRow()
         if 0 <= current_row < len(self.regions):
             del self.regions[current_row]
-            self.update_regions_list()
+            self._regions_dirty = True
+            self.regions_list.takeItem(current_row)
 
     def test_region(self):
         """Test translation on selected region"""
@@ -729,13 +913,28 @@ class MainWindow(QMainWindow):
 
     def update_regions_list(self):
         """Update regions list display"""
-        self.regions_list.clear()
-        for region in self.regions:
-            item_text = f"{region.name} ({region.x}, {region.y}, {region.width}x{region.height})"
-            item = QListWidgetItem(item_text)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Checked if region.enabled else Qt.CheckState.Unchecked)
-            self.regions_list.addItem(item)
+        if self.regions_list is None:
+            # Regions tab not built yet; it is populated when first shown
+            return
+        # Rebuild in one batch: no repaint or itemChanged/currentRow signals per row
+        self.regions_list.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.regions_list):
+                self.regions_list.clear()
+                for region in self.regions:
+                    self._append_region_item(region)
+        finally:
+            self.regions_list.setUpdatesEnabled(True)
+
+    def _append_region_item(self, region: TranslationRegion):
+        """Append a single row for region to the regions list"""
+        if self.regions_list is None:
+            return
+        item_text = f"{region.name} ({region.x}, {region.y}, {region.width}x{region.height})"
+        item = QListWidgetItem(item_text)
+        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+        item.setCheckState(Qt.CheckState.Checked if region.enabled else Qt.CheckState.Unchecked)
+        self.regions_list.addItem(item)
 
     def clear_all_translations(self):
         """Clear all translations and reset hashes to force new analysis"""
@@ -752,9 +951,6 @@ class MainWindow(QMainWindow):
 
     def start_translation(self):
         """Start translation process"""
-        # For QwenVLProcessor, model selection is handled differently
-        model_selection = self.translation_overlay.control_panel.model_combo.currentText()
-
         if self.model_warmup_worker.isRunning():
             self.header_status.setText("Model is still loading...")
             self.translation_overlay.control_panel.status_label.setText("Model loading...")
@@ -766,9 +962,11 @@ class MainWindow(QMainWindow):
         else:
             mode = TranslationMode.REGION_SELECT
 
-        # Source/Target are taken from the overlay panel; ensure they mirror main settings
-        src_lang = self.translation_overlay.control_panel.source_lang_combo.currentText()
-        tgt_lang = self.translation_overlay.control_panel.target_lang_combo.currentText()
+        # Model, Source/Target, interval and margin are taken from the overlay panel
+        snap = self._snapshot_panel()
+        model_selection = snap["model"]
+        src_lang = snap["source_lang"]
+        tgt_lang = snap["target_lang"]
 
         # Log current selections for diagnostics
         try:
@@ -781,18 +979,7 @@ class MainWindow(QMainWindow):
 
         # For VLProcessor, we don't need hint_source_lang/hint_target_lang
         # Set the model in the processor based on the selection
-        self.qwen_processor.config.model_name = model_selection
-        
-        # Set model size for Qwen3.5 models
-        if "translategemma" in model_selection.lower():
-            # For TranslateGemma, we don't use model_size, just the model name
-            pass
-        elif "9b" in model_selection.lower():
-            self.qwen_processor.config.model_size = "9b"
-        elif "4b" in model_selection.lower():
-            self.qwen_processor.config.model_size = "4b"
-        else:
-            self.qwen_processor.config.model_size = "auto"
+        self._apply_model_selection(model_selection)
 
         # Thinking mode is now controlled by checkbox, not model name
         # The thinking mode checkbox state is already synced via _on_thinking_mode_changed
@@ -802,8 +989,8 @@ class MainWindow(QMainWindow):
             "regions": self.regions,
             "source_lang": src_lang,
             "target_lang": tgt_lang,
-            "interval": self.translation_overlay.control_panel.interval_spin.value(),
-            "redaction_margin": self.translation_overlay.control_panel.margin_spin.value(),
+            "interval": snap["interval"],
+            "redaction_margin": snap["redaction_margin"],
             "minimize": self.minimize_on_start_checkbox.isChecked(),
         }
 
@@ -814,13 +1001,30 @@ class MainWindow(QMainWindow):
         self.translation_overlay.control_panel.status_label.setText("Loading model...")
         self.model_warmup_worker.start()
 
+    def _apply_model_selection(self, model_text: str):
+        """Point the VLProcessor config at the selected model name and size"""
+        self.qwen_processor.config.model_name = model_text
+
+        # Set model size for Qwen3.5 models
+        lowered = model_text.lower()
+        if "translategemma" in lowered:
+            # For TranslateGemma, we don't use model_size, just the model name
+            pass
+        elif "9b" in lowered:
+            self.qwen_processor.config.model_size = "9b"
+        elif "4b" in lowered:
+            self.qwen_processor.config.model_size = "4b"
+        else:
+            self.qwen_processor.config.model_size = "auto"
+
+    @pyqtSlot(bool, str)
     def _on_model_warmup_finished(self, ok: bool, error: str):
         if not ok:
             self._pending_translation_start = None
             self.start_button.setEnabled(True)
             self.stop_button.setEnabled(False)
             self.translation_overlay.control_panel.set_running(False)
-            self.tray_toggle_action.setText("Start Translation")
+            self._set_tray_toggle_text("Start Translation")
             detailed = error or "Qwen3.5 model failed to load"
             msg = f"Model load failed: {detailed}" if detailed else "Model load failed"
             self.header_status.setText(msg)
@@ -834,7 +1038,7 @@ class MainWindow(QMainWindow):
             self.start_button.setEnabled(True)
             self.stop_button.setEnabled(False)
             self.translation_overlay.control_panel.set_running(False)
-            self.tray_toggle_action.setText("Start Translation")
+            self._set_tray_toggle_text("Start Translation")
             self.header_status.setText("Ready")
             return
 
@@ -855,7 +1059,7 @@ class MainWindow(QMainWindow):
 
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
-        self.tray_toggle_action.setText("Stop Translation")
+        self._set_tray_toggle_text("Stop Translation")
         self.header_status.setText("Translating...")
 
         if cfg.get("minimize"):
@@ -875,7 +1079,7 @@ class MainWindow(QMainWindow):
         # Update UI
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
-        self.tray_toggle_action.setText("Start Translation")
+        self._set_tray_toggle_text("Start Translation")
         self.header_status.setText("Ready")
 
     def reset_settings(self):
@@ -890,47 +1094,65 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.settings.clear()
+            clear_settings()
             # Reload settings will fall back to defaults since they are cleared
             self.load_settings()
             # Additional UI cleanup that load_settings might not fully cover
             self.regions = []
+            self._regions_dirty = True
             self.update_regions_list()
             self.check_api_status()
             self.header_status.setText("Settings Reset")
 
+    def _block_signals(self) -> ExitStack:
+        """Temporarily block signals of the widgets whose changes trigger saves."""
+        # max_tokens_slider is left out: its valueChanged also drives the value label
+        widgets = (
+            self.api_model_edit, self.source_lang_combo, self.target_lang_combo,
+            self.interval_spinbox, self.overlay_opacity_slider, self.redaction_margin_spin,
+            self.debug_mode_checkbox, self.minimize_on_start_checkbox,
+            self.thinking_mode_checkbox, self.model_size_combo,
+            self.full_screen_radio, self.region_select_radio,
+        )
+        blockers = ExitStack()
+        for w in widgets:
+            blockers.enter_context(QSignalBlocker(w))
+        return blockers
+
     def load_settings(self):
         """Load application settings"""
-        self.api_model_edit.setCurrentText(self.settings.value("api_model", "Qwen3.5-9B (Auto-select)"))
-        self.source_lang_combo.setCurrentText(self.settings.value("source_lang", "auto"))
-        self.target_lang_combo.setCurrentText(self.settings.value("target_lang", "English"))
-        self.interval_spinbox.setValue(int(self.settings.value("interval", 2000)))
-        self.overlay_opacity_slider.setValue(int(self.settings.value("opacity", 80)))
-        self.redaction_margin_spin.setValue(int(self.settings.value("redaction_margin", 15)))
-        self.debug_mode_checkbox.setChecked(self.settings.value("debug_mode", "false") == "true")
-        self.minimize_on_start_checkbox.setChecked(self.settings.value("minimize_on_start", "true") == "true")
-
-        # Load Qwen3.5 specific settings
-        self.thinking_mode_checkbox.setChecked(self.settings.value("thinking_mode", "true") == "true")
-        self.max_tokens_slider.setValue(int(self.settings.value("max_tokens", 1024)))
-        self.model_size_combo.setCurrentText(self.settings.value("model_size_override", "Auto-detect"))
-
-        # Load mode
-        mode_str = self.settings.value("translation_mode", "full_screen")
-        self.full_screen_radio.setChecked(mode_str == "full_screen")
-        self.region_select_radio.setChecked(mode_str != "full_screen")
+        # Apply persisted values without firing the per-widget save/sync handlers
+        with self._block_signals():
+            self.api_model_edit.setCurrentText(setting("api_model", "Qwen3.5-9B (Auto-select)"))
+            self.source_lang_combo.setCurrentText(setting("source_lang", "auto"))
+            self.target_lang_combo.setCurrentText(setting("target_lang", "English"))
+            self.interval_spinbox.setValue(int(setting("interval", 2000)))
+            self.overlay_opacity_slider.setValue(int(setting("opacity", 80)))
+            self.redaction_margin_spin.setValue(int(setting("redaction_margin", 15)))
+            self.debug_mode_checkbox.setChecked(setting("debug_mode", "false") == "true")
+            self.minimize_on_start_checkbox.setChecked(setting("minimize_on_start", "true") == "true")
+
+            # Load Qwen3.5 specific settings
+            self.thinking_mode_checkbox.setChecked(setting("thinking_mode", "true") == "true")
+            self.max_tokens_slider.setValue(int(setting("max_tokens", 1024)))
+            self.model_size_combo.setCurrentText(setting("model_size_override", "Auto-detect"))
+
+            # Load mode
+            mode_str = setting("translation_mode", "full_screen")
+            self.full_screen_radio.setChecked(mode_str == "full_screen")
+            self.region_select_radio.setChecked(mode_str != "full_screen")
 
         # Sync with panel if it's already initialized
         try:
             panel = self.translation_overlay.control_panel
-            panel.blockSignals(True)
-            panel.source_lang_combo.setCurrentText(self.source_lang_combo.currentText())
-            panel.target_lang_combo.setCurrentText(self.target_lang_combo.currentText())
-            panel.model_combo.setCurrentText(self.api_model_edit.currentText())
-            panel.interval_spin.setValue(self.interval_spinbox.value())
-            panel.opacity_slider.setValue(self.overlay_opacity_slider.value())
-            panel.margin_spin.setValue(self.redaction_margin_spin.value())
-            panel.blockSignals(False)
+            with QSignalBlocker(panel):
+                panel.source_lang_combo.setCurrentText(self.source_lang_combo.currentText())
+                panel.target_lang_combo.setCurrentText(self.target_lang_combo.currentText())
+                panel.model_combo.setCurrentText(self.api_model_edit.currentText())
+                panel.interval_spin.setValue(self.interval_spinbox.value())
+                panel.opacity_slider.setValue(self.overlay_opacity_slider.value())
+                panel.margin_spin.setValue(self.redaction_margin_spin.value())
+            self._last_panel_snapshot = {}
         except Exception:
             pass
 
@@ -942,19 +1164,7 @@ class MainWindow(QMainWindow):
 
         # Sync VLProcessor object
         # For VLProcessor, model selection is handled differently
-        model_text = self.api_model_edit.currentText()
-        self.qwen_processor.config.model_name = model_text
-        
-        # Set model size for Qwen3.5 models
-        if "translategemma" in model_text.lower():
-            # For TranslateGemma, we don't use model_size, just the model name
-            pass
-        elif "9b" in model_text.lower():
-            self.qwen_processor.config.model_size = "9b"
-        elif "4b" in model_text.lower():
-            self.qwen_processor.config.model_size = "4b"
-        else:
-            self.qwen_processor.config.model_size = "auto"
+        self._apply_model_selection(self.api_model_edit.currentText())
 
         # Update thinking mode based on settings
         self.qwen_processor.config.thinking_mode = self.thinking_mode_checkbox.isChecked()
@@ -968,39 +1178,54 @@ class MainWindow(QMainWindow):
             self.qwen_processor.config.model_size = "8b"
 
         # Load regions
-        regions_json = self.settings.value("regions", "")
+        regions_json = setting("regions", "")
         if regions_json:
             try:
-                regions_data = json.loads(regions_json)
+                regions_data = json_utils.loads(regions_json)
                 self.regions = [TranslationRegion(**r) for r in regions_data]
                 self.update_regions_list()
             except Exception as e:
                 logger.error(f"Error loading regions: {e}")
 
-    def save_settings(self):
-        """Save application settings"""
-        self.settings.setValue("api_model", self.api_model_edit.currentText())
-        self.settings.setValue("source_lang", self.source_lang_combo.currentText())
-        self.settings.setValue("target_lang", self.target_lang_combo.currentText())
-        self.settings.setValue("interval", self.interval_spinbox.value())
-        self.settings.setValue("opacity", self.overlay_opacity_slider.value())
-        self.settings.setValue("redaction_margin", self.redaction_margin_spin.value())
-        self.settings.setValue("debug_mode", "true" if self.debug_mode_checkbox.isChecked() else "false")
-        self.settings.setValue("minimize_on_start", "true" if self.minimize_on_start_checkbox.isChecked() else "false")
-        
-        # Save mode
-        if self.full_screen_radio.isChecked():
-            mode_str = "full_screen"
-        else:
-            mode_str = "region_select"
-        self.settings.setValue("translation_mode", mode_str)
+    def _build_setting_readers(self) -> dict:
+        """Map each persisted key to a callable returning its current widget value"""
+        def flag(checkbox):
+            return lambda: "true" if checkbox.isChecked() else "false"
+
+        return {
+            "api_model": self.api_model_edit.currentText,
+            "source_lang": self.source_lang_combo.currentText,
+            "target_lang": self.target_lang_combo.currentText,
+            "interval": self.interval_spinbox.value,
+            "opacity": self.overlay_opacity_slider.value,
+            "redaction_margin": self.redaction_margin_spin.value,
+            "debug_mode": flag(self.debug_mode_checkbox),
+            "minimize_on_start": flag(self.minimize_on_start_checkbox),
+            "translation_mode": lambda: "full_screen" if self.full_screen_radio.isChecked() else "region_select",
+            # Qwen3.5 specific settings
+            "thinking_mode": flag(self.thinking_mode_checkbox),
+            "max_tokens": self.max_tokens_slider.value,
+            "model_size_override": self.model_size_combo.currentText,
+        }
 
-        # Save Qwen3.5 specific settings
-        self.settings.setValue("thinking_mode", "true" if self.thinking_mode_checkbox.isChecked() else "false")
-        self.settings.setValue("max_tokens", self.max_tokens_slider.value())
-        self.settings.setValue("model_size_override", self.model_size_combo.currentText())
+    def _flush_settings(self):
+        """Persist only the keys marked changed since the last flush"""
+        keys, self._dirty_keys = self._dirty_keys, set()
+        for key in keys:
+            store_setting(key, self._setting_readers[key]())
+        self._save_regions()
 
-        # Save regions
+    def save_settings(self):
+        """Save application settings"""
+        self._dirty_keys.clear()
+        for key, read in self._setting_readers.items():
+            store_setting(key, read())
+        self._save_regions()
+
+    def _save_regions(self):
+        """Persist regions (only when the list changed since the last save)"""
+        if not self._regions_dirty:
+            return
         regions_data = [
             {
                 "x": r.x,
@@ -1012,10 +1237,14 @@ class MainWindow(QMainWindow):
             }
             for r in self.regions
         ]
-        self.settings.setValue("regions", json.dumps(regions_data))
+        store_setting("regions", json_utils.dumps(regions_data))
+        self._regions_dirty = False
 
     def closeEvent(self, event):
         """Handle application close"""
         self.stop_translation()
+        # Flush any pending debounced save immediately
+        self._save_timer.stop()
         self.save_settings()
+        sync_settings()
         event.accept()
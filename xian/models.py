@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from enum import Enum
 from typing import Tuple, Optional
 
@@ -17,7 +18,7 @@ class TextStyle:
     rotation_angle: float = 0.0
     opacity: float = 1.0
 
-@dataclass
+@dataclass(slots=True)
 class TranslationRegion:
     """Represents a region to be translated"""
     x: int
@@ -27,7 +28,7 @@ class TranslationRegion:
     name: str = ""
     enabled: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     """Result from translation API with style information"""
     translated_text: str
@@ -39,3 +40,14 @@ class TranslationResult:
     original_text: str = ""
     style: Optional[TextStyle] = None
     rotation_angle: float = 0.0
+
+# All TranslationResult fields in constructor order, fetched in one C-level call
+_result_values = attrgetter(*(f.name for f in fields(TranslationResult)))
+
+def copy_result(result: TranslationResult) -> TranslationResult:
+    """Shallow copy of a result (cheaper than dataclasses.replace or copy.copy on slotted classes)"""
+    return TranslationResult(*_result_values(result))
+
+def normalize_text(text: str) -> str:
+    """Case- and whitespace-insensitive form of a translation, used to match results to bubbles"""
+    return text.strip().casefold()
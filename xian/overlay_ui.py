@@ -1,5 +1,8 @@
 from typing import List
 import logging
+from collections import OrderedDict
+from bisect import bisect_left, insort
+from functools import lru_cache, partial
 import os
 from PyQt6 import sip
 from PyQt6.QtWidgets import (
@@ -17,12 +20,24 @@ from PyQt6.QtWidgets import (
     QSlider,
     QFormLayout,
 )
-from PyQt6.QtCore import Qt, QTimer, QRect, QPoint, QSettings, QObject, pyqtSignal, QSize
-from PyQt6.QtGui import QPainter, QColor, QFont, QGuiApplication, QMouseEvent, QPaintEvent, QFontMetrics, QRegion, QIcon
-from .models import TranslationResult, TranslationMode
+from PyQt6.QtCore import Qt, QTimer, QRect, QPoint, QObject, pyqtSignal, pyqtSlot, QSize
+from PyQt6.QtGui import (
+    QPainter, QColor, QFont, QGuiApplication, QMouseEvent, QPaintEvent, QFontMetrics, QRegion, QIcon, QPixmap
+)
+from .models import TranslationResult, TranslationMode, copy_result, normalize_text
+from .settings import setting, store_setting
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on bubbles kept on screen; older unmatched ones are closed beyond this
+MAX_BUBBLES = 50
+
+
+def _source_rect(r: TranslationResult) -> tuple:
+    """Integer (left, top, right, bottom) of a result's source area, right/bottom exclusive"""
+    x, y = int(r.x), int(r.y)
+    return x, y, x + int(r.width), y + int(r.height)
+
 
 class _LogEmitter(QObject):
     message = pyqtSignal(str)
@@ -64,7 +79,11 @@ class OverlayControlPanel(QWidget):
         self._overlay_visible = True
         self.dragging = False
         self.drag_start_pos = QPoint()
-        self.settings = QSettings("Xian", "VideoGameTranslator")
+        self._applied_opacity = None  # Clamped opacity the current stylesheet was built for
+        self._opacity_timer = QTimer(self)
+        self._opacity_timer.setSingleShot(True)
+        self._opacity_timer.setInterval(50)
+        self._opacity_timer.timeout.connect(lambda: self.apply_opacity(self.opacity_slider.value()))
 
         root = QWidget(self)
         root.setObjectName("PanelRoot")
@@ -271,35 +290,37 @@ class OverlayControlPanel(QWidget):
         self.settings_btn.setText("Logs" if checked else "Settings")
 
     def _load_panel_settings(self):
-        s = self.settings
+        s = setting
         self.mode_combo.setCurrentText(
-            "Full Screen" if s.value("translation_mode", "full_screen") == "full_screen" else "Region Selection")
-        self.source_lang_combo.setCurrentText(s.value("source_lang", "auto"))
-        self.target_lang_combo.setCurrentText(s.value("target_lang", "English"))
-        self.model_combo.setCurrentText(s.value("model_name", "Qwen3.5-9B (Auto-select)"))
-        self.interval_spin.setValue(int(s.value("interval", 2000)))
-        self.opacity_slider.setValue(int(s.value("opacity", 80)))
-        self.margin_spin.setValue(int(s.value("redaction_margin", 15)))
-        self.debug_check.setChecked(s.value("debug_mode", "false") == "true")
-        self.combine_check.setChecked(s.value("combine_paragraphs", "true") == "true")
-        self.show_full_check.setChecked(s.value("show_full_text", "true") == "true")
-        self.show_link_check.setChecked(s.value("show_link_on_click", "false") == "true")
+            "Full Screen" if s("translation_mode", "full_screen") == "full_screen" else "Region Selection")
+        self.source_lang_combo.setCurrentText(s("source_lang", "auto"))
+        self.target_lang_combo.setCurrentText(s("target_lang", "English"))
+        self.model_combo.setCurrentText(s("model_name", "Qwen3.5-9B (Auto-select)"))
+        self.interval_spin.setValue(int(s("interval", 2000)))
+        self.opacity_slider.setValue(int(s("opacity", 80)))
+        self.margin_spin.setValue(int(s("redaction_margin", 15)))
+        self.debug_check.setChecked(s("debug_mode", "false") == "true")
+        self.combine_check.setChecked(s("combine_paragraphs", "true") == "true")
+        self.show_full_check.setChecked(s("show_full_text", "true") == "true")
+        self.show_link_check.setChecked(s("show_link_on_click", "false") == "true")
 
     def _save_panel_settings(self):
-        self.apply_opacity(self.opacity_slider.value())
-        s = self.settings
-        s.setValue("translation_mode",
-                   "full_screen" if self.mode_combo.currentText() == "Full Screen" else "region_select")
-        s.setValue("source_lang", self.source_lang_combo.currentText())
-        s.setValue("target_lang", self.target_lang_combo.currentText())
-        s.setValue("model_name", self.model_combo.currentText())
-        s.setValue("interval", self.interval_spin.value())
-        s.setValue("opacity", self.opacity_slider.value())
-        s.setValue("redaction_margin", self.margin_spin.value())
-        s.setValue("debug_mode", "true" if self.debug_check.isChecked() else "false")
-        s.setValue("combine_paragraphs", "true" if self.combine_check.isChecked() else "false")
-        s.setValue("show_full_text", "true" if self.show_full_check.isChecked() else "false")
-        s.setValue("show_link_on_click", "true" if self.show_link_check.isChecked() else "false")
+        # Rebuilding the panel stylesheet is costly; apply opacity at most every 50 ms
+        if not self._opacity_timer.isActive():
+            self._opacity_timer.start()
+        s = store_setting
+        s("translation_mode",
+          "full_screen" if self.mode_combo.currentText() == "Full Screen" else "region_select")
+        s("source_lang", self.source_lang_combo.currentText())
+        s("target_lang", self.target_lang_combo.currentText())
+        s("model_name", self.model_combo.currentText())
+        s("interval", self.interval_spin.value())
+        s("opacity", self.opacity_slider.value())
+        s("redaction_margin", self.margin_spin.value())
+        s("debug_mode", "true" if self.debug_check.isChecked() else "false")
+        s("combine_paragraphs", "true" if self.combine_check.isChecked() else "false")
+        s("show_full_text", "true" if self.show_full_check.isChecked() else "false")
+        s("show_link_on_click", "true" if self.show_link_check.isChecked() else "false")
         self.settings_changed.emit()
 
     def set_running(self, running: bool):
@@ -365,6 +386,9 @@ class OverlayControlPanel(QWidget):
     def apply_opacity(self, opacity: int):
         """Apply opacity to the control panel using style-based alpha (Wayland-safe)."""
         clamped = max(30, min(100, int(opacity)))
+        if clamped == self._applied_opacity:
+            return
+        self._applied_opacity = clamped
         panel_alpha = max(60, min(240, int(clamped * 2.4)))
         border_alpha = max(30, min(180, int(panel_alpha * 0.35)))
         button_alpha = max(80, min(230, int(clamped * 2.2)))
@@ -407,6 +431,9 @@ class OverlayControlPanel(QWidget):
 class OverlayWindow(QWidget):
     """Full-screen transparent container for bubbles to fix Wayland positioning"""
 
+    # Emitted when a child is dragged or resized so cached geometries can be dropped
+    children_geometry_changed = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         # On some Wayland compositors, keeping a window always-on-top requires
@@ -432,6 +459,12 @@ class OverlayWindow(QWidget):
         self.setGeometry(total_geo)
         # Initial mask is empty so it's click-through
         self.setMask(QRegion())
+
+        # Drag-time mask rebuilds are coalesced to at most one per frame (~16 ms)
+        self._mask_timer = QTimer(self)
+        self._mask_timer.setSingleShot(True)
+        self._mask_timer.setInterval(16)
+        self._mask_timer.timeout.connect(self._rebuild_mask)
         self.show()
 
     def paintEvent(self, event: QPaintEvent):
@@ -498,10 +531,16 @@ class OverlayWindow(QWidget):
         painter.end()
 
     def update_mask_during_drag(self):
-        """Recalculate mask from all children during a drag operation"""
+        """Schedule a mask recalculation from all children during a drag operation"""
+        self.children_geometry_changed.emit()
+        if not self._mask_timer.isActive():
+            self._mask_timer.start()
+
+    def _rebuild_mask(self):
         mask = QRegion()
-        # Base mask: all visible child widgets (bubbles + control panel)
-        for child in self.findChildren(QWidget):
+        # Base mask: all visible direct child widgets (bubbles + control panel); their
+        # descendants are already inside these rects and use other coordinate spaces
+        for child in self.findChildren(QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly):
             if child.isVisible() and not child.isWindow():
                 mask += child.geometry()
 
@@ -546,10 +585,49 @@ class OverlayWindow(QWidget):
 class TranslationBubble(QWidget):
     """Translation bubble, now a child of OverlayWindow for reliable positioning"""
 
+    # Shared by every bubble; the metrics are built on first use, once a QApplication exists
+    _metrics = None
+    # Rendered shadow + body pixmaps keyed by (width, height, dpr, fill rgb, alpha), in LRU
+    # order; sized so a full screen of differently sized bubbles never thrashes it
+    _backdrop_cache = OrderedDict()
+    _BACKDROP_CACHE_SIZE = 2 * MAX_BUBBLES
+    _LABEL_STYLE = "color: white; font-weight: bold; font-size: 14px; background: transparent;"
+    _PULSE_STYLE = "color: #4CAF50; font-weight: bold; font-size: 15px; background: transparent;"
+    _CLOSE_BTN_STYLE = """
+            QPushButton {
+                background-color: rgba(200, 0, 0, 180);
+                color: white;
+                border-radius: 10px;
+                font-weight: bold;
+                border: none;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: rgba(255, 0, 0, 220);
+            }
+        """
+
+    @classmethod
+    def _text_metrics(cls) -> QFontMetrics:
+        if cls._metrics is None:
+            cls._metrics = QFontMetrics(QFont("Arial", 12, QFont.Weight.Bold))
+        return cls._metrics
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _measure(text: str, width: int) -> tuple:
+        """Word-wrapped (width, height) of text laid out in a box of the given width"""
+        rect = TranslationBubble._text_metrics().boundingRect(
+            QRect(0, 0, width, 1000),
+            Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap,
+            text)
+        return rect.width(), rect.height()
+
     def __init__(self, result: TranslationResult, opacity: int, parent_overlay: QWidget = None,
                  default_expanded: bool = False):
         super().__init__(parent_overlay)
         self.result = result
+        self._cache_match_keys()
         self.opacity = opacity
         self.dragging = False
         self.expanded = bool(default_expanded)
@@ -574,19 +652,7 @@ class TranslationBubble(QWidget):
         self.close_btn = QPushButton("×", self)
         self.close_btn.setFixedSize(20, 20)
         self.close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba(200, 0, 0, 180);
-                color: white;
-                border-radius: 10px;
-                font-weight: bold;
-                border: none;
-                font-size: 16px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255, 0, 0, 220);
-            }}
-        """)
+        self.close_btn.setStyleSheet(self._CLOSE_BTN_STYLE)
         self.close_btn.clicked.connect(self.deleteLater)
 
         self.stack = QStackedWidget()
@@ -595,7 +661,7 @@ class TranslationBubble(QWidget):
         self.collapsed_label = QLabel()
         self.collapsed_label.setWordWrap(True)
         self.collapsed_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.collapsed_label.setStyleSheet("color: white; font-weight: bold; font-size: 14px; background: transparent;")
+        self.collapsed_label.setStyleSheet(self._LABEL_STYLE)
 
         # Expanded view
         self.scroll_area = QScrollArea()
@@ -606,7 +672,7 @@ class TranslationBubble(QWidget):
         self.expanded_label = QLabel()
         self.expanded_label.setWordWrap(True)
         self.expanded_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        self.expanded_label.setStyleSheet("color: white; font-weight: bold; font-size: 14px; background: transparent;")
+        self.expanded_label.setStyleSheet(self._LABEL_STYLE)
 
         self.scroll_area.setWidget(self.expanded_label)
 
@@ -621,9 +687,8 @@ class TranslationBubble(QWidget):
         style = self.result.style
         if not style:
             # Use default styling
-            default_style = "color: white; font-weight: bold; font-size: 14px; background: transparent;"
-            self.collapsed_label.setStyleSheet(default_style)
-            self.expanded_label.setStyleSheet(default_style)
+            self.collapsed_label.setStyleSheet(self._LABEL_STYLE)
+            self.expanded_label.setStyleSheet(self._LABEL_STYLE)
             return
         
         # Convert RGB to QColor
@@ -656,7 +721,8 @@ class TranslationBubble(QWidget):
         self.expanded_label.setStyleSheet(style_sheet)
 
     def _get_truncated_text(self, text, word_limit=8):
-        words = text.split()
+        # Split at most word_limit times: anything past the limit stays in one tail piece
+        words = text.split(None, word_limit)
         if len(words) <= word_limit:
             return text
         return " ".join(words[:word_limit]) + "..."
@@ -669,9 +735,6 @@ class TranslationBubble(QWidget):
 
     def update_geometry(self):
         # Calculate size based on text
-        font = QFont("Arial", 12, QFont.Weight.Bold)
-        metrics = QFontMetrics(font)
-
         padding = 20
         if not self.expanded:
             text = self.collapsed_label.text()
@@ -684,13 +747,10 @@ class TranslationBubble(QWidget):
             measure_width_i = int(round(measure_width))
             content_width_i = max(1, measure_width_i - padding * 2)
 
-            text_rect = metrics.boundingRect(
-                QRect(0, 0, content_width_i, 1000),
-                Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap,
-                text)
+            text_width, text_height = self._measure(text, content_width_i)
 
-            box_width = int(text_rect.width() + padding * 2)
-            box_height = int(text_rect.height() + padding * 2 + 10)
+            box_width = int(text_width + padding * 2)
+            box_height = int(text_height + padding * 2 + 10)
         else:
             # Expanded mode size
             box_width = 400
@@ -702,9 +762,11 @@ class TranslationBubble(QWidget):
 
         self.setFixedSize(box_width, box_height)
 
-        # Parent geometry (OverlayWindow covers screen(s))
-        if self.parentWidget():
-            parent_geo = self.parentWidget().geometry()
+        # Parent geometry (OverlayWindow covers screen(s)); bubbles are always created
+        # as its children, so the primary-screen lookup is only a fallback
+        parent = self.parentWidget()
+        if parent:
+            parent_geo = parent.geometry()
         else:
             parent_geo = QGuiApplication.primaryScreen().geometry()
 
@@ -737,74 +799,98 @@ class TranslationBubble(QWidget):
         if parent and hasattr(parent, 'update_mask_during_drag'):
             parent.update_mask_during_drag()
 
-    def update_content(self, result: TranslationResult):
-        """Update bubble with new translation result"""
+    def update_content(self, result: TranslationResult) -> bool:
+        """Update bubble with new translation result; returns True if its text or geometry changed"""
         if self.result.translated_text != result.translated_text:
             self.result = result
+            self._cache_match_keys()
             self._update_text_displays()
             self.update_geometry()
             self._pulse()
-        else:
-            # Just update coordinates if they changed significantly
-            old_pos = QPoint(int(self.result.x), int(self.result.y))
-            new_pos = QPoint(int(result.x), int(result.y))
-            if (old_pos - new_pos).manhattanLength() > 5:
-                self.result = result
-                self.update_geometry()
+            return True
+        # Just update coordinates if they changed significantly
+        old_pos = QPoint(int(self.result.x), int(self.result.y))
+        new_pos = QPoint(int(result.x), int(result.y))
+        if (old_pos - new_pos).manhattanLength() > 5:
+            self.result = result
+            self._cache_match_keys()
+            self.update_geometry()
+            return True
+        return False
+
+    def _cache_match_keys(self):
+        """Precompute the plain-int source rect and normalized text used to match new results"""
+        self._src_rect = _source_rect(self.result)
+        self._text_norm = normalize_text(self.result.translated_text)
 
     def _pulse(self):
         """Briefly highlight the bubble when updated"""
         target = self.expanded_label if self.expanded else self.collapsed_label
-        target.setStyleSheet("color: #4CAF50; font-weight: bold; font-size: 15px; background: transparent;")
+        target.setStyleSheet(self._PULSE_STYLE)
         QTimer.singleShot(500, self._reset_style)
 
     def _reset_style(self):
         if not sip.isdeleted(self):
-            style = "color: white; font-weight: bold; font-size: 14px; background: transparent;"
-            self.collapsed_label.setStyleSheet(style)
-            self.expanded_label.setStyleSheet(style)
+            self.collapsed_label.setStyleSheet(self._LABEL_STYLE)
+            self.expanded_label.setStyleSheet(self._LABEL_STYLE)
 
     def paintEvent(self, event: QPaintEvent):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        rect = self.rect()
-        
         # Check if we have style information for context-aware rendering
         style = self.result.style
-        
+        opacity_alpha = int(self.opacity * 2.55)
+
         if style and style.background_color:
             # Use detected background color with reconstruction
-            bg_color = QColor(*style.background_color)
-            opacity_alpha = int(self.opacity * 2.55)
+            fill_rgb = tuple(style.background_color)
             bg_alpha = max(100, min(200, opacity_alpha))
-            bg_color.setAlpha(bg_alpha)
-            
-            radius = 10
-            # Draw subtle shadow
-            painter.setBrush(QColor(0, 0, 0, min(200, bg_alpha + 20)))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(rect.translated(2, 2), radius, radius)
-            
-            # Draw reconstructed background
-            painter.setBrush(bg_color)
-            painter.setPen(QColor(255, 255, 255, 60))
-            painter.drawRoundedRect(rect, radius, radius)
         else:
             # Default styling
-            opacity_alpha = int(self.opacity * 2.55)
+            fill_rgb = (0, 0, 0)
             bg_alpha = max(80, min(170, opacity_alpha))
-            
-            radius = 10
-            # Draw subtle shadow
-            painter.setBrush(QColor(0, 0, 0, min(200, bg_alpha + 20)))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(rect.translated(2, 2), radius, radius)
-            
-            # Draw background
-            painter.setBrush(QColor(0, 0, 0, bg_alpha))
-            painter.setPen(QColor(255, 255, 255, 60))
-            painter.drawRoundedRect(rect, radius, radius)
+
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, fill_rgb, bg_alpha)
+        cache = self._backdrop_cache
+        backdrop = cache.get(key)
+        if backdrop is None:
+            backdrop = self._render_backdrop(self.size(), dpr, fill_rgb, bg_alpha)
+            cache[key] = backdrop
+            if len(cache) > self._BACKDROP_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, backdrop)
+
+    @classmethod
+    def clear_backdrop_cache(cls, *_):
+        """Release every cached backdrop pixmap; connected to the overlay window's destroyed signal"""
+        cls._backdrop_cache.clear()
+
+    @staticmethod
+    def _render_backdrop(size: QSize, dpr: float, fill_rgb: tuple, bg_alpha: int) -> QPixmap:
+        """Rasterize a bubble's rounded shadow and body once for reuse across repaints"""
+        backdrop = QPixmap(int(size.width() * dpr), int(size.height() * dpr))
+        backdrop.setDevicePixelRatio(dpr)
+        backdrop.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(backdrop)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRect(QPoint(0, 0), size)
+        radius = 10
+
+        # Draw subtle shadow
+        painter.setBrush(QColor(0, 0, 0, min(200, bg_alpha + 20)))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(rect.translated(2, 2), radius, radius)
+
+        # Draw background
+        painter.setBrush(QColor(*fill_rgb, bg_alpha))
+        painter.setPen(QColor(255, 255, 255, 60))
+        painter.drawRoundedRect(rect, radius, radius)
+        painter.end()
+        return backdrop
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -857,19 +943,47 @@ class TranslationOverlay(QObject):
         self.bubbles = []
         self.parent_window = parent_window
         self.overlay_window = OverlayWindow()
+        # Cached result of get_bubble_geometries(); None when bubbles changed since last call
+        self._geom_cache = None
+        # ids of tracked bubbles whose C++ side was destroyed; dropped from self.bubbles lazily
+        self._pending_removals = set()
+        self.overlay_window.children_geometry_changed.connect(self._invalidate_geometries)
+        # Backdrop pixmaps are shared class state; drop them with the window the bubbles lived in
+        self.overlay_window.destroyed.connect(TranslationBubble.clear_backdrop_cache)
+
+        # Translation batches arriving within 40 ms are coalesced; only the newest is applied
+        self._pending_batch = None
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.setInterval(40)
+        self._batch_timer.timeout.connect(self._apply_pending_batch)
+
+        # Mask refreshes requested in a burst (bubble adds/closes/moves) are applied once per frame
+        self._mask_timer = QTimer(self)
+        self._mask_timer.setSingleShot(True)
+        self._mask_timer.setInterval(16)
+        self._mask_timer.timeout.connect(self._apply_mask)
 
         # Parent the control panel to the overlay window for unification.
         self.control_panel = OverlayControlPanel(self.overlay_window)
 
-        # Persisted settings
-        self.settings = QSettings("Xian", "VideoGameTranslator")
-        self.opacity = int(self.settings.value("opacity", 80))
+        # Initial opacity from persisted settings; later changes arrive through set_opacity()
+        self.opacity = int(setting("opacity", 80))
         self._supports_window_opacity = self._detect_window_opacity_support()
 
         self.control_panel.request_clear.connect(self.clear_translations)
         self.control_panel.request_hide_overlay.connect(self.hide_overlay_window)
         self.control_panel.request_show_overlay.connect(self.show_overlay_window)
 
+        # Panel geometry the last overlap pass placed bubbles around; null while the panel is hidden
+        self._resolved_panel_geo = QRect()
+
+        # Panel layout flags read on every translation batch; mirrored here as they toggle
+        self._combine_mode = self.control_panel.combine_check.isChecked()
+        self._default_expanded = self.control_panel.show_full_check.isChecked()
+        self.control_panel.combine_check.toggled.connect(self._set_combine_mode)
+        self.control_panel.show_full_check.toggled.connect(self._set_default_expanded)
+
         # Ensure overlay window follows main window lifecycle
         if parent_window:
             parent_window.destroyed.connect(self.overlay_window.deleteLater)
@@ -885,6 +999,12 @@ class TranslationOverlay(QObject):
         self._keep_on_top_timer.timeout.connect(self._ensure_on_top)
         self._keep_on_top_timer.start()
 
+    def _set_combine_mode(self, checked: bool):
+        self._combine_mode = checked
+
+    def _set_default_expanded(self, checked: bool):
+        self._default_expanded = checked
+
     def _ensure_on_top(self):
         try:
             if self.overlay_window.isVisible():
@@ -971,10 +1091,36 @@ class TranslationOverlay(QObject):
         # Ensure input mask accounts for visible UI even before bubbles are drawn
         self._update_mask()
 
+    @pyqtSlot(list, object)
     def update_translations(self, translations: List[TranslationResult], updated_area: QRect = None):
+        """Queue a translation batch; a newer batch for the same area within 40 ms supersedes it"""
+        if self._pending_batch is not None:
+            pending_area = self._pending_batch[1]
+            same_area = pending_area is updated_area or (
+                pending_area is not None and updated_area is not None and pending_area == updated_area)
+            if not same_area:
+                # A batch for another area is not superseded; apply it before queuing this one
+                self._apply_pending_batch()
+        self._pending_batch = (translations, updated_area)
+        if not self._batch_timer.isActive():
+            self._batch_timer.start()
+
+    def flush_pending_translations(self):
+        """Apply a coalesced batch that is still waiting on its timer, if any"""
+        if self._pending_batch is not None:
+            self._apply_pending_batch()
+
+    def _apply_pending_batch(self):
+        self._batch_timer.stop()
+        batch, self._pending_batch = self._pending_batch, None
+        if batch is not None:
+            self._apply_translations(*batch)
+
+    def _apply_translations(self, translations: List[TranslationResult], updated_area: QRect = None):
         """Add new translations as bubbles with smart merging and grouping"""
+        self._invalidate_geometries()
         # Clean up any deleted objects first
-        self.bubbles = [b for b in self.bubbles if not sip.isdeleted(b)]
+        self._compact_bubbles()
 
         if not translations:
             # Do not auto-clear; keep existing bubbles until user clears them.
@@ -983,23 +1129,30 @@ class TranslationOverlay(QObject):
 
         # Limit the number of input translations to prevent O(N^2) hangs
         if len(translations) > 50:
-            logger.warning(f"Too many translations received ({len(translations)}), limiting to 50")
+            logger.warning("Too many translations received (%d), limiting to 50", len(translations))
             translations = translations[:50]
 
-        logger.info(
-            f"Updating overlay with {len(translations)} results" + (f" in area {updated_area}" if updated_area else ""))
+        logger.info("Updating overlay with %d results%s", len(translations),
+                    " in area %s" % (updated_area,) if updated_area else "")
         opacity = self.opacity
 
         # Track which bubbles were matched/created in this update
         matched_bubble_ids = set()
+        # Whether any bubble was created, closed, moved or re-texted (needs overlap/mask pass)
+        layout_changed = False
 
         # 1. Pre-process: Merge very close results from the API itself
         merged_results = []
+        # Merged results bucketed by 20px row. Input is sorted by y, so a result can only
+        # merge (y_diff < 20) with entries in its own row or the one above, and those
+        # buckets hold them in the same order as merged_results.
+        row_buckets = {}
         sorted_results = sorted(translations, key=lambda r: (r.y, r.x))
 
         for res in sorted_results:
             found_group = False
-            for existing in merged_results:
+            row = int(res.y // 20)
+            for existing in row_buckets.get(row - 1, []) + row_buckets.get(row, []):
                 y_diff = abs(existing.y - res.y)
                 x_diff = res.x - (existing.x + existing.width)
 
@@ -1020,23 +1173,17 @@ class TranslationOverlay(QObject):
                         break
 
             if not found_group:
-                from dataclasses import replace
-                merged_results.append(replace(res))
+                merged = copy_result(res)
+                merged_results.append(merged)
+                row_buckets.setdefault(row, []).append(merged)
 
         # Optional: combine nearby lines into paragraph clusters for readability
-        combine_mode = False
-        default_expanded = False
-        try:
-            if self.control_panel and not sip.isdeleted(self.control_panel):
-                combine_mode = self.control_panel.combine_check.isChecked()
-                default_expanded = self.control_panel.show_full_check.isChecked()
-        except Exception:
-            pass
+        combine_mode = self._combine_mode
+        default_expanded = self._default_expanded
 
         clustered_results: List[TranslationResult]
         if combine_mode:
             # Cluster by vertical proximity and horizontal overlap
-            from dataclasses import replace
             clusters = []  # each: dict(rect: QRect, items: List[TranslationResult])
             for res in merged_results:
                 placed = False
@@ -1076,7 +1223,7 @@ class TranslationOverlay(QObject):
                 if not combined_text:
                     continue
                 # Build a representative TranslationResult
-                base = replace(items[0])
+                base = copy_result(items[0])
                 base.translated_text = combined_text
                 base.x = float(rect.x())
                 base.y = float(rect.y())
@@ -1089,47 +1236,69 @@ class TranslationOverlay(QObject):
             clustered_results = merged_results
 
         # 2. Update existing bubbles or create new ones
+        # Live bubbles indexed by source top as sorted (top, position in self.bubbles) pairs.
+        # A bubble can only score or be an append target when its top lies within 500px of
+        # the result (text match), or within its own height (+36px gap) above it, or up to
+        # 100px below the result's bottom (centre distance); only that band is scanned.
+        by_top = sorted((b._src_rect[1], i) for i, b in enumerate(self.bubbles))
+        positions = {id(self.bubbles[i]): i for _, i in by_top}
+        max_height = max((self.bubbles[i]._src_rect[3] - top for top, i in by_top), default=0)
+
+        def reindex(bubble, old_top):
+            nonlocal max_height
+            pos = positions[id(bubble)]
+            del by_top[bisect_left(by_top, (old_top, pos))]
+            top, bottom = bubble._src_rect[1], bubble._src_rect[3]
+            insort(by_top, (top, pos))
+            max_height = max(max_height, bottom - top)
+
         for result in clustered_results:
             best_match = None
             highest_score = 0.0
             append_below_target = None
 
-            result_text_norm = result.translated_text.strip().lower()
+            result_text_norm = normalize_text(result.translated_text)
             new_source_rect = QRect(int(result.x), int(result.y), int(result.width), int(result.height))
+            # Matching below works on plain ints (exclusive right/bottom) rather than QRect calls
+            nx1, ny1, nx2, ny2 = _source_rect(result)
+            ncx, ncy = int((nx1 + nx2 - 1) / 2), int((ny1 + ny2 - 1) / 2)
 
-            for bubble in self.bubbles:
-                if sip.isdeleted(bubble): continue
+            lo = bisect_left(by_top, (ny1 - max(501, max_height + 36),))
+            hi = bisect_left(by_top, (max(ny1 + 501, ny2 + 101),))
+            # Visit candidates in self.bubbles order so ties resolve exactly as a full scan would
+            for pos in sorted(pos for _, pos in by_top[lo:hi]):
+                bubble = self.bubbles[pos]
 
                 score = 0.0
                 ex = bubble.result
-                ex_text_norm = ex.translated_text.strip().lower()
-                ex_source_rect = QRect(int(ex.x), int(ex.y), int(ex.width), int(ex.height))
+                ex_text_norm = bubble._text_norm
+                ex1, ey1, ex2, ey2 = bubble._src_rect
 
                 # Detect "append beneath" case: new text appears just below existing bubble's source
-                try:
-                    vert_gap = new_source_rect.top() - ex_source_rect.bottom()
-                    horiz_overlap = min(ex_source_rect.right(), new_source_rect.right()) - max(ex_source_rect.left(),
-                                                                                               new_source_rect.left())
-                    min_overlap = min(ex_source_rect.width(), new_source_rect.width()) * 0.3
-                    if 0 <= vert_gap <= 36 and horiz_overlap >= min_overlap:
-                        append_below_target = bubble
-                except Exception:
-                    pass
+                vert_gap = ny1 - (ey2 - 1)
+                horiz_overlap = min(ex2, nx2) - 1 - max(ex1, nx1)
+                min_overlap = min(ex2 - ex1, nx2 - nx1) * 0.3
+                if 0 <= vert_gap <= 36 and horiz_overlap >= min_overlap:
+                    append_below_target = bubble
 
                 iou = 0.0
-                if ex_source_rect.intersects(new_source_rect):
-                    inter = ex_source_rect.intersected(new_source_rect)
-                    union = ex_source_rect.united(new_source_rect)
-                    iou = (inter.width() * inter.height()) / (union.width() * union.height())
-
-                if ex_text_norm == result_text_norm or ex_text_norm in result_text_norm or result_text_norm in ex_text_norm:
-                    dist = abs(ex.x - result.x) + abs(ex.y - result.y)
-                    if dist < 500:
-                        score = 0.7 + (1.0 - min(1.0, dist / 500)) * 0.3
+                iw = min(ex2, nx2) - max(ex1, nx1)
+                ih = min(ey2, ny2) - max(ey1, ny1)
+                if iw > 0 and ih > 0:
+                    # Union is the bounding rect of both, as QRect.united() gives
+                    union_area = (max(ex2, nx2) - min(ex1, nx1)) * (max(ey2, ny2) - min(ey1, ny1))
+                    iou = (iw * ih) / union_area
+
+                # The text score needs dist < 500, so test that before any substring search
+                dist = abs(ex.x - result.x) + abs(ex.y - result.y)
+                if dist < 500 and (
+                        ex_text_norm == result_text_norm or ex_text_norm in result_text_norm
+                        or result_text_norm in ex_text_norm):
+                    score = 0.7 + (1.0 - min(1.0, dist / 500)) * 0.3
 
                 score = max(score, iou)
 
-                c_dist = (ex_source_rect.center() - new_source_rect.center()).manhattanLength()
+                c_dist = abs(int((ex1 + ex2 - 1) / 2) - ncx) + abs(int((ey1 + ey2 - 1) / 2) - ncy)
                 if c_dist < 100:
                     score = max(score, (1.0 - c_dist / 100) * 0.6)
 
@@ -1140,8 +1309,7 @@ class TranslationOverlay(QObject):
             # If we detected a likely line continuation beneath an existing bubble, append text
             if append_below_target and result.translated_text.strip():
                 try:
-                    from dataclasses import replace
-                    base = replace(append_below_target.result)
+                    base = copy_result(append_below_target.result)
                     # Append a new line with the new translated text
                     if base.translated_text.endswith("\n"):
                         base.translated_text = base.translated_text + result.translated_text.strip()
@@ -1154,7 +1322,9 @@ class TranslationOverlay(QObject):
                     base.y = float(union_rect.y())
                     base.width = float(union_rect.width())
                     base.height = float(union_rect.height())
-                    append_below_target.update_content(base)
+                    old_top = append_below_target._src_rect[1]
+                    layout_changed |= append_below_target.update_content(base)
+                    reindex(append_below_target, old_top)
                     matched_bubble_ids.add(id(append_below_target))
                     continue
                 except Exception:
@@ -1162,7 +1332,9 @@ class TranslationOverlay(QObject):
 
             if best_match and highest_score > 0.4:
                 try:
-                    best_match.update_content(result)
+                    old_top = best_match._src_rect[1]
+                    layout_changed |= best_match.update_content(result)
+                    reindex(best_match, old_top)
                     matched_bubble_ids.add(id(best_match))
                     continue
                 except (RuntimeError, AttributeError):
@@ -1172,8 +1344,14 @@ class TranslationOverlay(QObject):
                 bubble = TranslationBubble(result, opacity, self.overlay_window, default_expanded=default_expanded)
                 if not sip.isdeleted(bubble):
                     self.bubbles.append(bubble)
+                    positions[id(bubble)] = len(self.bubbles) - 1
+                    insort(by_top, (bubble._src_rect[1], len(self.bubbles) - 1))
+                    max_height = max(max_height, bubble._src_rect[3] - bubble._src_rect[1])
                     matched_bubble_ids.add(id(bubble))
-                    bubble.destroyed.connect(self._remove_bubble)
+                    # Bind the bubble itself: by the time ~QObject emits destroyed, the
+                    # TranslationBubble wrapper is detached and the signal's argument is a bare QObject
+                    bubble.destroyed.connect(partial(self._remove_bubble, bubble))
+                    layout_changed = True
 
                     if self.parent_window and not sip.isdeleted(self.parent_window):
                         if self.parent_window.hide_overlay_checkbox.isChecked():
@@ -1206,9 +1384,9 @@ class TranslationOverlay(QObject):
                     margin_area = updated_area.adjusted(-5, -5, 5, 5)
                     if margin_area.intersects(bubble_source_rect) or margin_area.contains(bubble_source_rect.center()):
                         bubble.close()
+                        layout_changed = True
 
         # 4. Limit total number of bubbles to prevent performance issues/crashes
-        MAX_BUBBLES = 50
         if len(self.bubbles) > MAX_BUBBLES:
             # Sort by age (oldest first - bubbles are appended, so early ones are older)
             # Actually, bubbles might be updated, but new ones are at the end.
@@ -1219,27 +1397,56 @@ class TranslationOverlay(QObject):
                 bubble = self.bubbles[i]
                 if id(bubble) not in matched_bubble_ids:
                     bubble.close()
+                    layout_changed = True
                     removed_count += 1
                     if removed_count >= num_to_remove:
                         break
 
-        # 5. Resolve overlaps between bubbles and the control panel so text stays readable
-        self._resolve_overlaps()
-
-        self._update_mask()
+        # 5. Resolve overlaps between bubbles and the control panel so text stays readable.
+        # A batch that only re-confirmed existing bubbles leaves both the layout and mask as they were,
+        # unless the control panel was moved onto them since the last pass.
+        if layout_changed or self._panel_obstacle() != self._resolved_panel_geo:
+            self._resolve_overlaps()
+            self._update_mask()
         try:
             self.control_panel.set_stats(len(self.bubbles))
         except Exception:
             pass
 
+    def _invalidate_geometries(self):
+        self._geom_cache = None
+
+    def _compact_bubbles(self):
+        """Drop destroyed bubbles from self.bubbles (no-op unless one was destroyed)"""
+        if self._pending_removals:
+            self.bubbles = [b for b in self.bubbles if id(b) not in self._pending_removals]
+            self._pending_removals.clear()
+
+    def _panel_obstacle(self) -> QRect:
+        """Control panel geometry bubbles must avoid; a null QRect when the panel is hidden"""
+        try:
+            if not sip.isdeleted(self.control_panel) and self.control_panel.isVisible():
+                return self.control_panel.geometry()
+        except Exception:
+            pass
+        return QRect()
+
     def _update_mask(self):
         """Update overlay window mask to allow click-through outside bubbles and control panel"""
+        # Every add/remove/reposition of bubbles ends in a mask refresh
+        self._invalidate_geometries()
+        self._compact_bubbles()
+        if not self._mask_timer.isActive():
+            self._mask_timer.start()
+
+    def _apply_mask(self):
+        self._compact_bubbles()
         if sip.isdeleted(self.overlay_window):
             return
 
         mask = QRegion()
         for bubble in self.bubbles:
-            if not sip.isdeleted(bubble) and bubble.isVisible():
+            if bubble.isVisible():
                 # We use the bubble's geometry which is relative to the overlay_window
                 mask += bubble.geometry()
 
@@ -1263,13 +1470,12 @@ class TranslationOverlay(QObject):
         placed: List[QRect] = []
 
         # Treat the control panel as an obstacle if it's visible
-        try:
-            if not sip.isdeleted(self.control_panel) and self.control_panel.isVisible():
-                placed.append(self.control_panel.geometry())
-        except Exception:
-            pass
+        self._resolved_panel_geo = self._panel_obstacle()
+        if not self._resolved_panel_geo.isNull():
+            placed.append(self._resolved_panel_geo)
 
-        bubbles = [b for b in self.bubbles if not sip.isdeleted(b) and b.isVisible()]
+        self._compact_bubbles()
+        bubbles = [b for b in self.bubbles if b.isVisible()]
         bubbles.sort(key=lambda b: (b.y(), b.x()))
 
         for bubble in bubbles:
@@ -1314,20 +1520,22 @@ class TranslationOverlay(QObject):
 
             placed.append(rect)
 
-    def _remove_bubble(self, qobj):
+    def _remove_bubble(self, bubble, *_):
         """Handle bubble destruction safely"""
-        for bubble in self.bubbles[:]:
-            if bubble is qobj or sip.isdeleted(bubble):
-                try:
-                    self.bubbles.remove(bubble)
-                except (ValueError, RuntimeError):
-                    pass
+        # Only record bubbles still tracked: the wrapper of an untracked one may be freed
+        # afterwards and its id reused by a new bubble before the next compaction
+        if bubble in self.bubbles:
+            self._pending_removals.add(id(bubble))
         self._update_mask()
 
     def clear_translations(self):
         """Clear all active translation bubbles"""
         logger.info("Clearing all translations")
-        to_close = [b for b in self.bubbles if not sip.isdeleted(b)]
+        # A batch still waiting to be applied predates the clear
+        self._pending_batch = None
+        self._batch_timer.stop()
+        self._compact_bubbles()
+        to_close = self.bubbles
         self.bubbles = []
         for bubble in to_close:
             try:
@@ -1340,11 +1548,16 @@ class TranslationOverlay(QObject):
         except Exception:
             pass
 
+    def bubble_count(self) -> int:
+        """Number of bubbles currently tracked by the overlay"""
+        return len(self.bubbles)
+
     def get_redaction_geometries(self) -> List[QRect]:
         """Return geometries to redact from the capture (bubbles + control panel).
         Returns global screen coordinates.
         """
-        active_geoms = self.get_bubble_geometries()
+        # With no bubbles only the control panel needs redacting
+        active_geoms = self.get_bubble_geometries() if self.bubble_count() else []
 
         try:
             if not sip.isdeleted(self.control_panel) and self.control_panel.isVisible():
@@ -1352,7 +1565,7 @@ class TranslationOverlay(QObject):
                 top_left = self.control_panel.mapToGlobal(QPoint(0, 0))
                 active_geoms.append(QRect(top_left, self.control_panel.size()))
         except Exception as e:
-            logger.debug(f"Failed to get control panel geometry for redaction: {e}")
+            logger.debug("Failed to get control panel geometry for redaction: %s", e)
 
         return active_geoms
 
@@ -1360,33 +1573,36 @@ class TranslationOverlay(QObject):
         """Return list of current bubble geometries and original source geometries for redaction.
         Returns global screen coordinates.
         """
+        if self._geom_cache is not None:
+            return list(self._geom_cache)
+
+        self._compact_bubbles()
         active_geoms = []
         for b in self.bubbles:
-            if not sip.isdeleted(b):
-                try:
-                    # 1. Current bubble geometry (global coords)
-                    top_left = b.mapToGlobal(QPoint(0, 0))
-                    active_geoms.append(QRect(top_left, b.size()))
-
-                    # 2. Original source text geometry
-                    # These were already stored in image-relative coords during OCR.
-                    # We need to translate them to global coords.
-                    # Assuming the capture was the full virtual desktop:
-                    r = b.result
-
-                    # We'll use the overlay_window's origin to map back to global if needed,
-                    # but actually r.x/y are relative to the capture.
-                    # If we assume capture was at total_geo.topLeft(), then:
-                    if not sip.isdeleted(self.overlay_window):
-                        origin = self.overlay_window.geometry().topLeft()
-                        active_geoms.append(QRect(
-                            int(r.x + origin.x()),
-                            int(r.y + origin.y()),
-                            int(r.width),
-                            int(r.height)
-                        ))
-                except (RuntimeError, AttributeError):
-                    pass
+            try:
+                # 1. Current bubble geometry (global coords)
+                top_left = b.mapToGlobal(QPoint(0, 0))
+                active_geoms.append(QRect(top_left, b.size()))
+
+                # 2. Original source text geometry
+                # These were already stored in image-relative coords during OCR.
+                # We need to translate them to global coords.
+                # Assuming the capture was the full virtual desktop:
+                r = b.result
+
+                # We'll use the overlay_window's origin to map back to global if needed,
+                # but actually r.x/y are relative to the capture.
+                # If we assume capture was at total_geo.topLeft(), then:
+                if not sip.isdeleted(self.overlay_window):
+                    origin = self.overlay_window.geometry().topLeft()
+                    active_geoms.append(QRect(
+                        int(r.x + origin.x()),
+                        int(r.y + origin.y()),
+                        int(r.width),
+                        int(r.height)
+                    ))
+            except (RuntimeError, AttributeError):
+                pass
 
-        self.bubbles = [b for b in self.bubbles if not sip.isdeleted(b)]
-        return active_geoms
+        self._geom_cache = active_geoms
+        return list(active_geoms)
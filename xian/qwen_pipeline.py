@@ -1,29 +1,55 @@
 """Vision-Language Processing Pipeline for unified OCR and translation."""
 
 import asyncio
+import importlib.util
 import io
 import logging
 import os
 import re
 import time
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
-import torch
 from PIL import Image
-import pynvml
 
-try:
-    from vllm import AsyncLLMEngine, AsyncEngineArgs
-    VLLM_AVAILABLE = True
-except ImportError:
-    VLLM_AVAILABLE = False
+# vLLM (and the torch stack it pulls in) is imported lazily in init_engine so the
+# GUI can start without paying for it; only probe that it is installed here.
+VLLM_AVAILABLE = importlib.util.find_spec("vllm") is not None
 
 from .models import TranslationResult, TextStyle
 from .style_detection import StyleDetector, BackgroundReconstructor
 
 logger = logging.getLogger(__name__)
 
+# Unified OCR+Translation prompt; only the target language varies per call.
+_PROMPT_TEMPLATE = """Extract all visible text from this image in its original language, then provide a natural translation to {target_lang}. Format your response as:
+
+ORIGINAL TEXT:
+[line-by-line extracted text with approximate positioning]
+
+TRANSLATION:
+[fluent translation preserving context and layout intent]
+
+Rules:
+- Preserve line breaks and approximate spatial grouping
+- For UI elements/buttons: translate naturally while preserving function
+- For proper nouns/place names: keep original unless commonly localized
+- Ignore decorative/artistic text without semantic meaning
+- If text is ambiguous due to image quality, indicate uncertainty"""
+
+
+@lru_cache(maxsize=32)
+def _build_prompt(target_lang: str) -> str:
+    """Render the prompt template for a target language (cached per language)."""
+    return _PROMPT_TEMPLATE.format(target_lang=target_lang)
+
+
+# Section extractors for the model reply, compiled once instead of per frame.
+_ORIGINAL_SECTION_RE = re.compile(r'ORIGINAL TEXT:\s*(.*?)\s*TRANSLATION:', re.DOTALL | re.IGNORECASE)
+_TRANSLATION_SECTION_RE = re.compile(r'TRANSLATION:\s*(.*)', re.DOTALL | re.IGNORECASE)
+
+
 @dataclass
 class VLConfig:
     """Configuration for Vision-Language processing"""
@@ -43,7 +69,9 @@ class VLProcessor:
         self.config = config or VLConfig()
         self.engine = None
         self.model_id = None
+        self._engine_key = None  # Settings the current engine was built with
         self.is_translategemma = False  # Flag to track if using TranslateGemma
+        self._vram_gb = None  # Cached result of detect_vram (total VRAM does not change at runtime)
         
         # Initialize style detection and background reconstruction
         self.style_detector = StyleDetector()
@@ -56,13 +84,18 @@ class VLProcessor:
             )
     
     def detect_vram(self) -> int:
-        """Detect total VRAM in GB using pynvml."""
+        """Detect total VRAM in GB using pynvml (probed once, then cached)."""
+        if self._vram_gb is not None:
+            return self._vram_gb
+
         try:
+            import pynvml
             pynvml.nvmlInit()
             device_count = pynvml.nvmlDeviceGetCount()
             
             if device_count == 0:
                 logger.warning("No NVIDIA GPUs detected, falling back to CPU")
+                self._vram_gb = 0
                 return 0
             
             total_vram_bytes = 0
@@ -74,10 +107,12 @@ class VLProcessor:
             # Convert to GB
             total_vram_gb = total_vram_bytes // (1024**3)
             logger.info(f"Detected {total_vram_gb}GB of total VRAM across {device_count} GPU(s)")
+            self._vram_gb = total_vram_gb
             return total_vram_gb
             
         except Exception as e:
             logger.warning(f"Could not detect VRAM via pynvml: {e}. Falling back to CPU.")
+            self._vram_gb = 0
             return 0
     
     def select_model(self, vram_gb: int) -> str:
@@ -160,7 +195,15 @@ class VLProcessor:
             # For CPU, we'll use a different approach or warn
             # For now, let's assume we have a GPU or the user knows the implications
         
-        self.model_id = self.select_model(vram_gb)
+        model_id = self.select_model(vram_gb)
+
+        # Re-running warmup with unchanged settings must not rebuild the engine
+        engine_key = (model_id, self.config.thinking_mode,
+                      self.config.gpu_memory_utilization, self.config.dtype)
+        if self.engine is not None and engine_key == self._engine_key:
+            logger.info(f"Vision-language engine already initialized with model: {model_id}")
+            return
+        self.model_id = model_id
         
         logger.info(f"Initializing vision-language engine with model: {self.model_id}")
         
@@ -180,9 +223,11 @@ class VLProcessor:
                 "enable_thinking": self.config.thinking_mode
             }
         
+        from vllm import AsyncLLMEngine, AsyncEngineArgs
         engine_args = AsyncEngineArgs(**engine_kwargs)
         
         self.engine = await AsyncLLMEngine.from_engine_args(engine_args)
+        self._engine_key = engine_key
         logger.info("Vision-language engine initialized successfully")
     
     def preprocess_image(self, image_data: bytes) -> Image.Image:
@@ -215,46 +260,15 @@ class VLProcessor:
     
     def create_prompt(self, target_lang: str, thinking_mode: bool = False) -> str:
         """Create unified OCR+Translation prompt template."""
-        if self.is_translategemma:
-            # TranslateGemma-specific prompt
-            prompt = f"""Extract all visible text from this image in its original language, then provide a natural translation to {target_lang}. Format your response as:
-
-ORIGINAL TEXT:
-[line-by-line extracted text with approximate positioning]
-
-TRANSLATION:
-[fluent translation preserving context and layout intent]
-
-Rules:
-- Preserve line breaks and approximate spatial grouping
-- For UI elements/buttons: translate naturally while preserving function
-- For proper nouns/place names: keep original unless commonly localized
-- Ignore decorative/artistic text without semantic meaning
-- If text is ambiguous due to image quality, indicate uncertainty"""
-        else:
-            # Qwen3.5-specific prompt (thinking handled by chat_template_kwargs)
-            prompt = f"""Extract all visible text from this image in its original language, then provide a natural translation to {target_lang}. Format your response as:
-
-ORIGINAL TEXT:
-[line-by-line extracted text with approximate positioning]
-
-TRANSLATION:
-[fluent translation preserving context and layout intent]
-
-Rules:
-- Preserve line breaks and approximate spatial grouping
-- For UI elements/buttons: translate naturally while preserving function
-- For proper nouns/place names: keep original unless commonly localized
-- Ignore decorative/artistic text without semantic meaning
-- If text is ambiguous due to image quality, indicate uncertainty"""
-        
-        return prompt
+        # Qwen3.5 and TranslateGemma share the same prompt; thinking for Qwen3.5
+        # is handled by chat_template_kwargs rather than the prompt text.
+        return _build_prompt(target_lang)
     
     def parse_response(self, response: str) -> Tuple[str, str]:
         """Parse the model response to extract original text and translation."""
         # Look for ORIGINAL TEXT and TRANSLATION sections
-        original_match = re.search(r'ORIGINAL TEXT:\s*(.*?)\s*TRANSLATION:', response, re.DOTALL | re.IGNORECASE)
-        translation_match = re.search(r'TRANSLATION:\s*(.*)', response, re.DOTALL | re.IGNORECASE)
+        original_match = _ORIGINAL_SECTION_RE.search(response)
+        translation_match = _TRANSLATION_SECTION_RE.search(response)
         
         original_text = original_match.group(1).strip() if original_match else ""
         translation = translation_match.group(1).strip() if translation_match else ""
@@ -392,6 +406,7 @@ Rules:
         if self.engine:
             # vLLM doesn't have a direct close method, but we can set it to None
             self.engine = None
+            self._engine_key = None
 
 
 # Additional helper functions
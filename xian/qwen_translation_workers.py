@@ -3,6 +3,7 @@
 import time
 import logging
 from collections import OrderedDict
+from dataclasses import asdict
 from typing import List
 import asyncio
 import imagehash
@@ -13,7 +14,7 @@ from PyQt6.QtCore import QThread, pyqtSignal, QRect, QElapsedTimer
 from PyQt6.QtGui import QImage, QPainter, QColor, QGuiApplication
 from PyQt6.QtWidgets import QThreadPool, QRunnable
 
-from .models import TranslationMode, TranslationRegion, TranslationResult
+from .models import TranslationMode, TranslationRegion, TranslationResult, TextStyle
 from .screen_capture import ScreenCapture
 from .qwen_pipeline import QwenVLProcessor
 from .translation_db import TranslationDB
@@ -50,6 +51,8 @@ class QwenTranslationWorker(QThread):
         self.translation_cache_max = 16
         self._last_translation_signature = None
         self._empty_signature = ("__empty__",)
+        # Event loop owned by the worker thread, reused for every frame while running
+        self._loop = None
         
         # Initialize perceptual cache
         self.perceptual_cache = {}  # dhash -> translation result
@@ -100,6 +103,18 @@ class QwenTranslationWorker(QThread):
         from PyQt6.QtCore import QElapsedTimer
         timer = QElapsedTimer()
 
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._run_loop(timer)
+        finally:
+            self._loop.close()
+            self._loop = None
+
+        logger.info("Qwen translation worker thread stopped")
+
+    def _run_loop(self, timer):
+        """Capture/translate cycle, paced to roughly one frame per second"""
         while self.running:
             timer.start()
             # Request latest geometries for redaction
@@ -124,8 +139,6 @@ class QwenTranslationWorker(QThread):
                 logger.error(f"Translation worker error: {e}")
                 self.msleep(1000)
 
-        logger.info("Qwen translation worker thread stopped")
-
     def _translate_with_qwen(self):
         """Capture screen, perform OCR and translation with vision-language model"""
         workflow_start = time.time()
@@ -147,12 +160,8 @@ class QwenTranslationWorker(QThread):
                 # Capture is assumed to be the full virtual desktop.
                 capture_geo = ScreenCapture.get_virtual_desktop_geometry()
                 image = self._redact_image(image, self.active_geometries, capture_geo.topLeft())
-
-                from PyQt6.QtCore import QBuffer, QIODevice
-                buffer = QBuffer()
-                buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-                image.save(buffer, "PNG")
-                image_data = bytes(buffer.buffer())
+                # The capture is already JPEG; re-encode losslessly so redaction adds no artifacts
+                image_data = ScreenCapture.encode_image(image, "PNG")
             redact_time = time.time() - redact_start
 
         # Preprocess image for better results
@@ -179,7 +188,7 @@ class QwenTranslationWorker(QThread):
         if db_cached:
             logger.debug("Database cache hit; reusing cached translation")
             # Convert stored data back to TranslationResult objects
-            cached_results = [TranslationResult(**item) for item in db_cached]
+            cached_results = [self._result_from_db(item) for item in db_cached]
             self.perceptual_cache[dhash] = cached_results  # Also add to in-memory cache
             self.translation_ready.emit(cached_results, None)
             self.status_update.emit("Using cached translation (DB)")
@@ -210,19 +219,14 @@ class QwenTranslationWorker(QThread):
         vl_start = time.time()
         try:
             # Process the frame using vision-language model
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                translated_results = loop.run_until_complete(
-                    self.qwen_processor.process_frame(image_data, self.target_lang)
-                )
-            finally:
-                loop.close()
+            translated_results = self._loop.run_until_complete(
+                self.qwen_processor.process_frame(image_data, self.target_lang)
+            )
             
             vl_time = time.time() - vl_start
 
             if not translated_results:
-                logger.info(f"Vision-language model finished in {vl_time:.2f}s: No text detected")
+                logger.info("Vision-language model finished in %.2fs: No text detected", vl_time)
                 self.status_update.emit("No text detected")
 
                 # Keep existing translations on screen; just record the empty state
@@ -231,12 +235,13 @@ class QwenTranslationWorker(QThread):
                 self._last_translation_signature = self._empty_signature
                 return
 
-            logger.info(f"Vision-language model processed image in {vl_time:.2f}s, got {len(translated_results)} results")
+            logger.info("Vision-language model processed image in %.2fs, got %d results",
+                        vl_time, len(translated_results))
 
             workflow_total = time.time() - workflow_start
-            logger.info(f"Workflow stats: Capture: {capture_time:.2f}s, Redact: {redact_time:.2f}s, "
-                        f"Preprocess: {preprocess_time:.2f}s, Hash: {hash_time:.2f}s, "
-                        f"VL-Model: {vl_time:.2f}s, Total: {workflow_total:.2f}s")
+            logger.info("Workflow stats: Capture: %.2fs, Redact: %.2fs, Preprocess: %.2fs, Hash: %.2fs, "
+                        "VL-Model: %.2fs, Total: %.2fs",
+                        capture_time, redact_time, preprocess_time, hash_time, vl_time, workflow_total)
 
             if translated_results:
                 # Store in both caches
@@ -246,7 +251,7 @@ class QwenTranslationWorker(QThread):
                 self.perceptual_cache[dhash] = translated_results
                 
                 # Store in database cache
-                db_data = [result.__dict__ for result in translated_results]
+                db_data = [asdict(result) for result in translated_results]
                 self.translation_db.put_translation(dhash, db_data)
 
                 signature = self._fingerprint_translations(translated_results)
@@ -322,6 +327,14 @@ class QwenTranslationWorker(QThread):
                 self.image_cache_max,
             )
 
+    @staticmethod
+    def _result_from_db(item: dict) -> TranslationResult:
+        """Rebuild a TranslationResult stored via asdict(), including its nested TextStyle"""
+        style = item.get("style")
+        if isinstance(style, dict):
+            item = {**item, "style": TextStyle(**style)}
+        return TranslationResult(**item)
+
     def _fingerprint_translations(self, translations: List[TranslationResult]):
         try:
             return tuple(sorted(
@@ -351,6 +364,9 @@ class QwenTranslatorStatusWorker(QThread):
         # For now, just return True to indicate the processor is available
         is_available = True  # Placeholder - actual implementation would check if model is loaded
         models = ["Qwen3.5-4B", "Qwen3.5-9B", "TranslateGemma-4B", "TranslateGemma-12B"]
+        if self.isInterruptionRequested():
+            # Superseded by a newer check; let it report instead
+            return
         self.status_changed.emit(is_available, models)
 
 
@@ -3,6 +3,7 @@ import logging
 import os
 import subprocess
 import tempfile
+import threading
 from typing import Optional, Tuple
 from PyQt6.QtGui import QImage, QGuiApplication
 from PyQt6.QtCore import QBuffer, QIODevice, Qt, QRect
@@ -22,9 +23,33 @@ def _check_screenshot_available():
 
 SCREENSHOT_AVAILABLE = _check_screenshot_available()
 
+# Encoding used for captured frames. JPEG encodes several times faster than PNG for
+# full-screen shots and the VL model input tolerates it; use "PNG" for lossless dumps.
+CAPTURE_FORMAT = "JPG"
+CAPTURE_QUALITY = 85
+
+# Per-thread encode sink reused across frames (captures run on the worker thread)
+_encode_sink = threading.local()
+
 class ScreenCapture:
     """Handle screen capture using multiple backends for Wayland/X11 compatibility"""
 
+    @staticmethod
+    def encode_image(image, fmt: str = "PNG", quality: int = -1) -> bytes:
+        """Encode a QImage/QPixmap to bytes through a reusable per-thread buffer"""
+        sink = getattr(_encode_sink, "buffer", None)
+        if sink is None:
+            sink = QBuffer()
+            _encode_sink.buffer = sink
+        # QBuffer keeps its previous contents on a plain WriteOnly open; Truncate empties
+        # them so a shorter encode never carries stale trailing bytes from an earlier frame
+        sink.open(QIODevice.OpenModeFlag.WriteOnly | QIODevice.OpenModeFlag.Truncate)
+        try:
+            image.save(sink, fmt, quality)
+            return bytes(sink.data())
+        finally:
+            sink.close()
+
     @staticmethod
     def get_virtual_desktop_geometry() -> QRect:
         """Get the geometry of the entire virtual desktop (all screens combined)"""
@@ -34,7 +59,7 @@ class ScreenCapture:
         return total_geo
 
     @staticmethod
-    def capture_screen() -> Optional[bytes]:
+    def capture_screen(fmt: str = CAPTURE_FORMAT) -> Optional[bytes]:
         """Capture entire screen using best available method"""
         
         # Try Wayland-specific methods first if on Wayland
@@ -42,7 +67,7 @@ class ScreenCapture:
         desktop = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
 
         if is_wayland:
-            logger.debug(f"Wayland detected, desktop: {desktop}")
+            logger.debug("Wayland detected, desktop: %s", desktop)
             # 1. KDE Plasma - Spectacle
             if "kde" in desktop:
                 logger.debug("Trying Spectacle backend...")
@@ -57,15 +82,15 @@ class ScreenCapture:
 
             # 3. Generic Wayland - grim
             logger.debug("Trying grim backend...")
-            data = ScreenCapture._capture_grim()
+            data = ScreenCapture._capture_grim(fmt)
             if data: return data
 
         # 4. Fallback to PyQt (works on X11, usually returns black on Wayland)
         logger.debug("Falling back to PyQt backend...")
-        return ScreenCapture._capture_pyqt()
+        return ScreenCapture._capture_pyqt(fmt)
 
     @staticmethod
-    def _capture_pyqt() -> Optional[bytes]:
+    def _capture_pyqt(fmt: str = CAPTURE_FORMAT) -> Optional[bytes]:
         """Capture entire screen using PyQt (X11 only)"""
         try:
             screen = QGuiApplication.primaryScreen()
@@ -74,10 +99,7 @@ class ScreenCapture:
                 if pixmap.isNull():
                     return None
                 
-                buffer = QBuffer()
-                buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-                pixmap.save(buffer, "PNG")
-                data = bytes(buffer.buffer())
+                data = ScreenCapture.encode_image(pixmap, fmt, CAPTURE_QUALITY)
                 
                 if ScreenCapture._is_image_empty(data):
                     logger.debug("PyQt capture returned empty/black image")
@@ -164,10 +186,13 @@ class ScreenCapture:
         return None
 
     @staticmethod
-    def _capture_grim() -> Optional[bytes]:
+    def _capture_grim(fmt: str = CAPTURE_FORMAT) -> Optional[bytes]:
         """Capture screen using grim (Generic Wayland)"""
+        cmd = ["grim"]
+        if fmt.upper() in ("JPG", "JPEG"):
+            cmd += ["-t", "jpeg", "-q", str(CAPTURE_QUALITY)]
         try:
-            result = subprocess.run(["grim", "-"], capture_output=True, timeout=5)
+            result = subprocess.run(cmd + ["-"], capture_output=True, timeout=5)
             if result.returncode == 0:
                 logger.debug("Captured screen via grim")
                 return result.stdout
@@ -198,10 +223,10 @@ class ScreenCapture:
         return all(p == first for p in points)
 
     @staticmethod
-    def capture_region(x: int, y: int, width: int, height: int) -> Optional[bytes]:
+    def capture_region(x: int, y: int, width: int, height: int, fmt: str = CAPTURE_FORMAT) -> Optional[bytes]:
         """Capture specific screen region"""
         try:
-            full_data = ScreenCapture.capture_screen()
+            full_data = ScreenCapture.capture_screen(fmt)
             if not full_data:
                 return None
                 
@@ -220,13 +245,8 @@ class ScreenCapture:
                 
             cropped = image.copy(rect)
             
-            # Convert back to bytes
-            buffer = QBuffer()
-            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-            cropped.save(buffer, "PNG")
-            data = bytes(buffer.buffer())
-            
-            return data
+            # Convert back to bytes losslessly; the full capture was already encoded as fmt
+            return ScreenCapture.encode_image(cropped, "PNG")
 
         except Exception as e:
             logger.error(f"Region capture error: {e}")
@@ -251,10 +271,7 @@ class ScreenCapture:
         # This is a basic way to "normalize" using QImage if we don't want OpenCV
         # For efficiency, we just return the grayscale image for now which already helps
 
-        buffer = QBuffer()
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        image.save(buffer, "PNG")
-        return bytes(buffer.buffer())
+        return ScreenCapture.encode_image(image, "PNG")
 
     @staticmethod
     def compress_image(image_data: bytes, quality: int = 50) -> Tuple[bytes, int, int]:
@@ -270,15 +287,13 @@ class ScreenCapture:
         image = image.convertToFormat(QImage.Format.Format_RGB888)
 
         # 3. Save with compression to memory buffer
-        buffer = QBuffer()
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        image.save(buffer, "JPG", quality)
-        
-        return bytes(buffer.buffer()), image.width(), image.height()
+        data = ScreenCapture.encode_image(image, "JPG", quality)
+
+        return data, image.width(), image.height()
 
     @staticmethod
     def calculate_hash(image_input) -> str:
-        """Calculate a simple perceptual hash for change detection"""
+        """Calculate a content digest of a downscaled frame for change detection"""
         if isinstance(image_input, bytes):
             image = QImage.fromData(image_input)
         else:
@@ -286,15 +301,13 @@ class ScreenCapture:
 
         if not image or image.isNull():
             return ""
-        
-        # Downsample to a very small size to ignore minor noise/flicker
-        small = image.scaled(16, 16, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.FastTransformation)
+
+        # This digest keys the image cache and gates the "unchanged" skip, so it must change
+        # whenever on-screen text does. Area-average down to 64x64 grayscale (every source
+        # pixel contributes) and hash the whole buffer exactly; fuzzy matching is left to
+        # the separate imagehash dHash key.
+        small = image.scaled(64, 64, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
         small = small.convertToFormat(QImage.Format.Format_Grayscale8)
-        
-        bits = []
-        for y in range(16):
-            for x in range(16):
-                # Using a simple bitmask based on average pixel value
-                bits.append(str(small.pixelColor(x, y).red()))
-        
-        return hashlib.md5(",".join(bits).encode()).hexdigest()
+
+        raw = small.constBits().asstring(small.sizeInBytes())
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
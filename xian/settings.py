@@ -0,0 +1,58 @@
+from functools import lru_cache
+
+from PyQt6.QtCore import QSettings
+
+# Process-wide mirror of the persisted values, shared by every window that writes settings.
+# Filled from the store in one pass on first use; None until then.
+_cache = None
+_unsynced = False  # True once setValue ran since the last sync()
+
+
+@lru_cache(maxsize=None)
+def get_settings():
+    """Return the process-wide QSettings store, created on first use"""
+    return QSettings("Xian", "VideoGameTranslator")
+
+
+def _values() -> dict:
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = {key: settings.value(key) for key in settings.allKeys()}
+    return _cache
+
+
+def setting(key: str, default):
+    """Return a persisted setting from the shared cache, or default if it was never stored"""
+    return _values().get(key, default)
+
+
+def store_setting(key: str, value) -> bool:
+    """Persist a setting unless the store already holds it; returns True if it was written"""
+    global _unsynced
+    values = _values()
+    if key in values:
+        cached = values[key]
+        # Values read back from the INI backend are strings, so 5 and "5" are equal
+        if cached == value or str(cached) == str(value):
+            return False
+    values[key] = value
+    get_settings().setValue(key, value)
+    _unsynced = True
+    return True
+
+
+def clear_settings():
+    """Remove every persisted setting and reset the shared cache to match"""
+    global _cache, _unsynced
+    get_settings().clear()
+    _cache = {}
+    _unsynced = True
+
+
+def sync_settings():
+    """Flush pending writes to the backing store, if there are any"""
+    global _unsynced
+    if _unsynced:
+        get_settings().sync()
+        _unsynced = False
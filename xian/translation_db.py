@@ -1,12 +1,13 @@
 """Translation Database Layer with LMDB for persistent caching."""
 
-import json
 import logging
 import pickle
 from typing import Optional, Dict, Any
 import lmdb
 import threading
 
+from . import json_utils
+
 logger = logging.getLogger(__name__)
 
 class TranslationDB:
@@ -31,7 +32,7 @@ class TranslationDB:
             with self.lock:
                 with self.env.begin(write=True) as txn:
                     # Serialize the translation data to JSON string
-                    serialized_data = json.dumps(translation_data)
+                    serialized_data = json_utils.dumps(translation_data)
                     txn.put(dhash.encode('utf-8'), serialized_data.encode('utf-8'))
                     return True
         except Exception as e:
@@ -46,7 +47,7 @@ class TranslationDB:
                     data = txn.get(dhash.encode('utf-8'))
                     if data:
                         # Deserialize from JSON string
-                        return json.loads(data.decode('utf-8'))
+                        return json_utils.loads(data)
                     return None
         except Exception as e:
             logger.error(f"Error retrieving translation from DB: {e}")